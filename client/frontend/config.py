@@ -3,13 +3,14 @@
 Provides settings management for the application.
 """
 import os
+from types import SimpleNamespace
 
-CONFIG = {
-    "logging_enabled": True,
-    "use_gpu_only": False,
-    "synchronous_mode": False,
-    "chatgpt_enabled": bool(os.getenv("OPENAI_API_KEY"))
-}
+CONFIG = SimpleNamespace(
+    logging_enabled=True,
+    use_gpu_only=False,
+    synchronous_mode=False,
+    chatgpt_enabled=bool(os.getenv("OPENAI_API_KEY"))
+)
 
 def get(key):
     """Get a configuration value by key.
@@ -20,7 +21,7 @@ def get(key):
     Returns:
         Value associated with the key or None if not found
     """
-    return CONFIG.get(key)
+    return getattr(CONFIG, key, None)
 
 def set_config(key, value):
     """Set a configuration value.
@@ -29,4 +30,4 @@ def set_config(key, value):
         key: Configuration key to set
         value: Value to associate with the key
     """
-    CONFIG[key] = value
+    setattr(CONFIG, key, value)
@@ -12,399 +12,486 @@ and docstring problems.
 import os
 import re
 import sys
+import functools
+import json
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Define paths
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CLIENT_DIR = os.path.join(BASE_DIR, "client")
 
+# Patterns compiled once at import time
+_IMPORT_DOTENV_RE = re.compile(r'import (.*?)from dotenv import load_dotenv', re.DOTALL)
+# The shared 'async def on' prefix is matched once before the alternation
+_ASYNC_ON_RE = re.compile(r'async def (on(?:Connect|Open|Message|Close))\b')
+# Lines of adjust_hierarchy_with_debugger.py that are replaced as a whole
+_RUN_CHECK_LINE_RE = re.compile(r'^.*result = subprocess\.run\(check=True\).*$', re.MULTILINE)
+_CAPTURE_LINE_RE = re.compile(r'^.*capture_output=True, text=True\).*$', re.MULTILINE)
+# Trailing whitespace at the end of any line (or of the file)
+_TRAILING_WS_RE = re.compile(r'[ \t\r\f\v]+$', re.MULTILINE)
 
-def fix_adjust_hierarchy_with_debugger():
-    """Fix syntax errors in the adjust_hierarchy_with_debugger.py file."""
-    filepath = os.path.join(CLIENT_DIR, "adjust_hierarchy_with_debugger.py")
+# Generated module docstring, split around the module name
+_MODULE_DOC_PREFIX = '"""'
+_MODULE_DOC_SUFFIX = ' module for AILinux.\n\nThis module provides functionality for the AILinux system.\n"""\n'
 
-    if not os.path.exists(filepath):
-        print(f"File not found: {filepath}")
-        return False
-    
-    print("Fixing adjust_hierarchy_with_debugger.py...")
+# Progress messages, written to stdout in batches by flush_log()
+_LOG = []
 
-    try:
+# Files touched by the fixers: path -> [content on disk (None for new files), current content]
+FILE_CACHE = {}
+
+# Modification times (ns) of the files fully processed by earlier runs; files
+# unchanged since then are skipped. Loaded in main() and saved after flush().
+FIX_CACHE_FILE = ".ailinux_fix_cache.json"
+FIX_CACHE = {}
+# Files a fixer failed on in this run; they are never recorded as processed
+FAILED_FILES = set()
+
+
+def _log(message):
+    """Queue a progress message; flush_log() writes the queued messages."""
+    _LOG.append(message)
+
+
+def flush_log():
+    """Write all queued progress messages to stdout with a single call."""
+    if _LOG:
+        sys.stdout.write('\n'.join(_LOG) + '\n')
+        sys.stdout.flush()
+        _LOG.clear()
+
+
+def _iter_py_files(root):
+    """Yield the Python files below root in the same order as os.walk().
+
+    The entry types come straight from os.scandir(), so no extra stat()
+    call is made per file.
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk(), don't descend into symlinked directories
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        yield entry.path
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+@functools.lru_cache(maxsize=None)
+def _collect_py_files():
+    """Return all Python files in the client directory, walking it only once."""
+    return list(_iter_py_files(CLIENT_DIR))
+
+
+def _has_module_docstring(content):
+    """Return True if the content starts with a docstring, ignoring leading whitespace.
+
+    Only the leading whitespace is scanned, no stripped copy of the file is made.
+    """
+    for i, ch in enumerate(content):
+        if not ch.isspace():
+            return content.startswith('"""', i)
+    return False
+
+
+def _read(filepath):
+    """Return the current content of a file, reading it from disk only once."""
+    if filepath not in FILE_CACHE:
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
+        FILE_CACHE[filepath] = [content, content]
+    return FILE_CACHE[filepath][1]
 
-        # Fix the unexpected indent issue on line 15
-        lines = content.split('\n')
-        
-        # The error is on this line:
-        # result = subprocess.run(check=True)(['pylint', '--disable=all', '--enable=error'],
-        # Fix it by correcting the function call
-        for i, line in enumerate(lines):
-            if "result = subprocess.run(check=True)" in line:
-                lines[i] = "result = subprocess.run(['pylint', '--disable=all', '--enable=error'], check=True,"
-            if "capture_output=True, text=True)" in line:
-                # Next line has the remaining arguments
-                lines[i] = "                         capture_output=True, text=True)"
-
-        # Add missing docstring for the module
-        if not lines[0].startswith('"""'):
-            lines.insert(0, '"""Tool to adjust directory hierarchy and run pylint checks."""')
 
-        # Write the fixed content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+def _write(filepath, content):
+    """Replace the content of a file in the cache; flush() writes it to disk.
 
-        print("✅ Fixed adjust_hierarchy_with_debugger.py")
-        return True
-    
-    except Exception as e:
-        print(f"Error fixing {filepath}: {str(e)}")
+    flush() skips files whose content ends up the same as on disk, so fixers
+    that change nothing cause no write at all.
+    """
+    if filepath not in FILE_CACHE:
+        # Compare new files against what a previous run may have left on disk
+        try:
+            _read(filepath)
+        except FileNotFoundError:
+            FILE_CACHE[filepath] = [None, content]
+    FILE_CACHE[filepath][1] = content
+
+
+def _unchanged_since_last_run(filepath):
+    """Return True if an earlier run processed the file and it wasn't modified since."""
+    mtime = FIX_CACHE.get(filepath)
+    if mtime is None:
+        return False
+    try:
+        return os.stat(filepath).st_mtime_ns == mtime
+    except OSError:
         return False
 
 
-def fix_missing_docstrings():
-    """Add missing docstrings to Python files."""
-    python_files = []
-    
-    # Find all Python files in the client directory
-    for root, _, files in os.walk(CLIENT_DIR):
-        for file in files:
-            if file.endswith('.py'):
-                python_files.append(os.path.join(root, file))
-    
-    fixed_count = 0
-    for filepath in python_files:
+def load_fix_cache():
+    """Load the file modification times recorded by the previous run."""
+    try:
+        with open(FIX_CACHE_FILE, 'r', encoding='utf-8') as f:
+            FIX_CACHE.update(json.load(f))
+    except (OSError, ValueError):
+        # No usable cache: process every file
+        pass
+
+
+def save_fix_cache():
+    """Record the modification times of the files processed in this run."""
+    for filepath in FILE_CACHE:
+        if filepath in FAILED_FILES:
+            FIX_CACHE.pop(filepath, None)
+            continue
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Check if the file is missing a module docstring
-            if not content.strip().startswith('"""'):
-                filename = os.path.basename(filepath)
-                print(f"Adding missing docstring to {filename}")
-                
-                # Generate a simple docstring based on the filename
-                module_name = os.path.splitext(filename)[0]
-                module_name = module_name.replace('_', ' ').title()
-                docstring = f'"""{module_name} module for AILinux.\n\nThis module provides functionality for the AILinux system.\n"""\n'
-
-                # Add the docstring to the beginning of the file
-                content = docstring + content
-
-                # Write the fixed content back
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                
-                fixed_count += 1
+            FIX_CACHE[filepath] = os.stat(filepath).st_mtime_ns
+        except OSError:
+            FIX_CACHE.pop(filepath, None)
+
+    try:
+        with open(FIX_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(FIX_CACHE, f)
+    except OSError as e:
+        _log(f"Error writing {FIX_CACHE_FILE}: {str(e)}")
 
+
+def _atomic_write(filepath, content):
+    """Write a file through a temporary file in the same directory and os.replace().
+
+    Readers never see a partially written file, even if the script is interrupted.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(filepath), prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        # mkstemp() creates the file private; keep the permissions of the file it replaces
+        try:
+            mode = os.stat(filepath).st_mode & 0o7777
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def flush():
+    """Write every cached file whose content was changed by the fixers."""
+    written = 0
+    created = False
+    for filepath, entry in FILE_CACHE.items():
+        original, current = entry
+        if current == original:
+            continue
+        try:
+            _atomic_write(filepath, current)
+            entry[0] = current
+            created = created or original is None
+            written += 1
         except Exception as e:
-            print(f"Error adding docstring to {filepath}: {str(e)}")
-    
-    print(f"✅ Added missing docstrings to {fixed_count} Python files")
-    return fixed_count > 0
+            FAILED_FILES.add(filepath)
+            _log(f"Error writing {filepath}: {str(e)}")
 
+    # New files are not part of the cached directory listing yet
+    if created:
+        _collect_py_files.cache_clear()
 
-def fix_file_sync_client():
-    """Fix the file-sync-client.py errors."""
-    filepath = os.path.join(CLIENT_DIR, "file-sync-client.py")
+    return written
 
-    if not os.path.exists(filepath):
-        print(f"File not found: {filepath}")
-        return False
-    
-    print("Fixing file-sync-client.py...")
 
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Fix the missing # Potential unused import: import for 'stat' module
-        if "# Potential unused import: import stat" not in content:
-            # Add the stat # Potential unused import: import at the top with other imports
-            modified_content = re.sub(
-                r'import (.*?)from dotenv import load_dotenv',
-                r'import \1import stat\nfrom dotenv import load_dotenv',
-                content,
-                flags=re.DOTALL
-            )
-
-            # Fix the possibly-used-before-assignment error with stat
-            # by ensuring stat is imported before it's used
-
-            # Remove trailing whitespace
-            modified_content = '\n'.join(line.rstrip() for line in modified_content.split('\n'))
+def _fix_adjust_hierarchy(content):
+    """Fix syntax errors in adjust_hierarchy_with_debugger.py."""
+    # Fix the unexpected indent issue on line 15
+    # The error is on this line:
+    # result = subprocess.run(check=True)(['pylint', '--disable=all', '--enable=error'],
+    # Fix it by correcting the function call; the whole line is replaced in place
+    # instead of splitting the file into lines
+    content = _RUN_CHECK_LINE_RE.sub(
+        "result = subprocess.run(['pylint', '--disable=all', '--enable=error'], check=True,",
+        content)
+    # Next line has the remaining arguments
+    content = _CAPTURE_LINE_RE.sub(
+        "                         capture_output=True, text=True)",
+        content)
 
-            # Write the fixed content back
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(modified_content)
+    # Add missing docstring for the module
+    if not content.startswith('"""'):
+        content = '"""Tool to adjust directory hierarchy and run pylint checks."""\n' + content
 
-            print("✅ Fixed file-sync-client.py")
-            return True
-    
-    except Exception as e:
-        print(f"Error fixing {filepath}: {str(e)}")
-        return False
+    return content
 
 
-def fix_alphaos_py():
-    """Fix the issues in alphaos.py."""
-    filepath = os.path.join(CLIENT_DIR, "alphaos.py")
+def _fix_file_sync_client(content):
+    """Fix the file-sync-client.py errors."""
+    # Fix the missing # Potential unused import: import for 'stat' module
+    if "# Potential unused import: import stat" in content:
+        return content
 
-    if not os.path.exists(filepath):
-        print(f"File not found: {filepath}")
-        return False
-    
-    print("Fixing alphaos.py...")
+    # Add the stat # Potential unused import: import at the top with other imports
+    modified_content = _IMPORT_DOTENV_RE.sub(
+        r'import \1import stat\nfrom dotenv import load_dotenv',
+        content
+    )
 
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Fix the method override issues by removing 'async' to match parent class expectations
-        # or by using the correct method names
-        modified_content = content.replace(
-            "async def onConnect", 
-            "def onConnect"
-        ).replace(
-            "async def onOpen", 
-            "def onOpen"
-        ).replace(
-            "async def onMessage", 
-            "def onMessage"
-        ).replace(
-            "async def onClose",
-            "def onClose"
-        )
-
-        # Add docstring if missing
-        if not modified_content.strip().startswith('"""'):
-            modified_content = '"""WebSocket client for AILinux using Autobahn.\n\nProvides connection to WebSocket server on derleiti.de.\n"""\n' + modified_content
+    # Fix the possibly-used-before-assignment error with stat
+    # by ensuring stat is imported before it's used
 
-        # Write the fixed content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(modified_content)
+    # Remove trailing whitespace
+    return _TRAILING_WS_RE.sub('', modified_content)
 
-        print("✅ Fixed alphaos.py")
-        return True
-    
-    except Exception as e:
-        print(f"Error fixing {filepath}: {str(e)}")
-        return False
 
+def _fix_alphaos(content):
+    """Fix the issues in alphaos.py."""
+    # Fix the method override issues by removing 'async' to match parent class expectations
+    # or by using the correct method names
+    modified_content = _ASYNC_ON_RE.sub(r'def \1', content)
+
+    # Add docstring if missing
+    if not _has_module_docstring(modified_content):
+        modified_content = '"""WebSocket client for AILinux using Autobahn.\n\nProvides connection to WebSocket server on derleiti.de.\n"""\n' + modified_content
 
-def fix_start_js():
+    return modified_content
+
+
+def _fix_start_js(content):
     """Fix syntax issues in start.js."""
-    filepath = os.path.join(CLIENT_DIR, "start.js")
+    # Fix invalid syntax in the file
+    # The main issue is with multi-line strings in JavaScript
+    # Use template literals with backticks for multi-line strings
+    return content.replace(
+        "logMessage(`Configuration: Flask=${flaskHost}:${flaskPort}, WebSocket=${wsServerUrl}`,\nstartLogPath)",
+        "logMessage(`Configuration: Flask=${flaskHost}:${flaskPort}, WebSocket=${wsServerUrl}`, startLogPath)"
+    )
 
-    if not os.path.exists(filepath):
-        print(f"File not found: {filepath}")
-        return False
-    
-    print("Fixing start.js...")
 
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Fix invalid syntax in the file
-        # The main issue is with multi-line strings in JavaScript
-        # Use template literals with backticks for multi-line strings
-        if ""
-            "logMessage(`Configuration: Flask=${flaskHost}:${flaskPort}, WebSocket=${wsServerUrl}`,\nstartLogPath)" in content:
-            modified_content = content.replace(
-                "logMessage(`Configuration: Flask=${flaskHost}:${flaskPort}, WebSocket=${wsServerUrl}`,\nstartLogPath)",
-                "logMessage(`Configuration: Flask=${flaskHost}:${flaskPort}, WebSocket=${wsServerUrl}`, startLogPath)"
-            )
-        
-            # Write the fixed content back
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(modified_content)
+def _strip_and_add_docstring(content, docstring):
+    """Remove trailing whitespace and add the docstring if the module has none.
 
-            print("✅ Fixed start.js")
-            return True
-    
-    except Exception as e:
-        print(f"Error fixing {filepath}: {str(e)}")
-        return False
+    Stripping trailing whitespace never changes where the content starts, so the
+    docstring check runs on the original content and the file is only scanned
+    once, by the whitespace pattern.
+    """
+    if _has_module_docstring(content):
+        return _TRAILING_WS_RE.sub('', content)
+    return docstring + _TRAILING_WS_RE.sub('', content)
 
 
-def fix_websocket_client_py():
+def _fix_websocket_client(content):
     """Fix trailing whitespace in websocket_client.py."""
-    filepath = os.path.join(CLIENT_DIR, "websocket_client.py")
-    
-    if not os.path.exists(filepath):
-        print(f"File not found: {filepath}")
-        return False
-    
-    print("Fixing websocket_client.py...")
-    
+    return _strip_and_add_docstring(
+        content,
+        '"""WebSocket client for connecting to AILinux server.\n\nProvides functionality to establish WebSocket connections and handle messages.\n"""\n')
+
+
+def _fix_websocket_client_module(content):
+    """Fix websocket-client.py for its new snake_case name."""
+    return _strip_and_add_docstring(
+        content,
+        '"""WebSocket client module for AILinux.\n\nProvides connection functionality to AILinux WebSocket server.\n"""\n')
+
+
+def _fix_config(content):
+    """Fix the config.py file with the redefined built-in 'set'."""
+    # Rename the 'set' function to avoid redefining the built-in
+    modified_content = content.replace("def set(key, value):", "def set_config(key, value):")
+
+    # Add docstring if missing
+    if not _has_module_docstring(modified_content):
+        modified_content = '"""Configuration module for AILinux frontend.\n\nProvides settings management for the application.\n"""\n' + modified_content
+
+    return modified_content
+
+
+# File fixes as (file to fix, file to write or None for the same file, transform).
+# Paths are relative to CLIENT_DIR; each transform maps the old content to the new one.
+FIXES = [
+    ("adjust_hierarchy_with_debugger.py", None, _fix_adjust_hierarchy),
+    ("file-sync-client.py", None, _fix_file_sync_client),
+    ("alphaos.py", None, _fix_alphaos),
+    ("start.js", None, _fix_start_js),
+    ("websocket_client.py", None, _fix_websocket_client),
+    # Write to a new file with a proper snake_case name; the old file is kept
+    ("websocket-client.py", "websocket_client_module.py", _fix_websocket_client_module),
+    (os.path.join("frontend", "config.py"), None, _fix_config),
+]
+
+
+def apply_fix(source, target, transform):
+    """Apply one entry of FIXES; return True if the file is fixed afterwards."""
+    filepath = os.path.join(CLIENT_DIR, source)
+    _log(f"Fixing {source}...")
+
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        if target is None and _unchanged_since_last_run(filepath):
+            _log(f"✅ {source} is unchanged since the last run")
+            return True
+
+        content = _read(filepath)
+        modified_content = transform(content)
+
+        if target:
+            _write(os.path.join(CLIENT_DIR, target), modified_content)
+            _log(f"✅ Fixed {source} by creating {target}")
+            return True
+
+        if modified_content == content:
+            _log(f"✅ {source} is already fixed")
+            return True
 
-        # Fix trailing whitespace
-        modified_content = '\n'.join(line.rstrip() for line in content.split('\n'))
-        
-        # Add docstring if missing
-        if not modified_content.strip().startswith('"""'):
-            modified_content = '"""WebSocket client for connecting to AILinux server.\n\nProvides functionality to establish WebSocket connections and handle messages.\n"""\n' + modified_content
-        
         # Write the fixed content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(modified_content)
+        _write(filepath, modified_content)
 
-        print("✅ Fixed websocket_client.py")
+        _log(f"✅ Fixed {source}")
         return True
-    
+
+    except FileNotFoundError:
+        # Opening the file is the existence check, no separate stat() needed
+        _log(f"File not found: {filepath}")
+        return False
+
     except Exception as e:
-        print(f"Error fixing {filepath}: {str(e)}")
+        FAILED_FILES.add(filepath)
+        _log(f"Error fixing {filepath}: {str(e)}")
         return False
 
 
-def fix_websocket_client_with_dash():
-    """Fix the naming issue in websocket-client.py."""
-    old_filepath = os.path.join(CLIENT_DIR, "websocket-client.py")
-    new_filepath = os.path.join(CLIENT_DIR, "websocket_client_module.py")
-    
-    if not os.path.exists(old_filepath):
-        print(f"File not found: {old_filepath}")
-        return False
-    
-    print("Fixing websocket-client.py naming issue...")
-    
+def _add_missing_docstring(filepath):
+    """Add a module docstring to a single file; return its name if one was added."""
+    if _unchanged_since_last_run(filepath):
+        return None
+
     try:
-        with open(old_filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = _read(filepath)
 
-        # Fix trailing whitespace
-        modified_content = '\n'.join(line.rstrip() for line in content.split('\n'))
-        
-        # Add docstring if missing
-        if not modified_content.strip().startswith('"""'):
-            modified_content = '"""WebSocket client module for AILinux.\n\nProvides connection functionality to AILinux WebSocket server.\n"""\n' + modified_content
-        
-        # Write to the new file with a proper snake_case name
-        with open(new_filepath, 'w', encoding='utf-8') as f:
-            f.write(modified_content)
+        # Check if the file is missing a module docstring
+        if not _has_module_docstring(content):
+            filename = os.path.basename(filepath)
 
-        # Optionally, remove the old file
-        # os.remove(old_filepath)
+            # Generate a simple docstring based on the filename
+            module_name = os.path.splitext(filename)[0]
+            module_name = module_name.replace('_', ' ').title()
+            # Add the docstring to the beginning of the file, building the
+            # new content with a single join
+            content = ''.join((_MODULE_DOC_PREFIX, module_name, _MODULE_DOC_SUFFIX, content))
+
+            # Write the fixed content back
+            _write(filepath, content)
+
+            return filename
 
-        print("✅ Fixed websocket-client.py naming issue by creating websocket_client_module.py")
-        return True
-    
     except Exception as e:
-        print(f"Error fixing {old_filepath}: {str(e)}")
-        return False
+        FAILED_FILES.add(filepath)
+        _log(f"Error adding docstring to {filepath}: {str(e)}")
 
+    return None
 
-def fix_config_py():
-    """Fix the config.py file with the redefined built-in 'set'."""
-    filepath = os.path.join(CLIENT_DIR, "frontend", "config.py")
-    
-    if not os.path.exists(filepath):
-        print(f"File not found: {filepath}")
-        return False
-    
-    print("Fixing config.py...")
-    
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
 
-        # Rename the 'set' function to avoid redefining the built-in
-        modified_content = content.replace("def set(key, value):", "def set_config(key, value):")
-        
-        # Add docstring if missing
-        if not modified_content.strip().startswith('"""'):
-            modified_content = '"""Configuration module for AILinux frontend.\n\nProvides settings management for the application.\n"""\n' + modified_content
-        
-        # Write the fixed content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(modified_content)
+def fix_missing_docstrings():
+    """Add missing docstrings to Python files."""
+    # Files are independent and reading them is I/O bound, so use a thread pool
+    with ThreadPoolExecutor() as executor:
+        added = list(executor.map(_add_missing_docstring, _collect_py_files()))
 
-        print("✅ Fixed config.py")
-        return True
-    
-    except Exception as e:
-        print(f"Error fixing {filepath}: {str(e)}")
-        return False
+    fixed_count = 0
+    for filename in added:
+        if filename:
+            _log(f"Adding missing docstring to {filename}")
+            fixed_count += 1
+
+    _log(f"✅ Added missing docstrings to {fixed_count} Python files")
+    return fixed_count > 0
 
 
 def run_pylint():
     """Run pylint on the codebase to check if the fixes resolved the issues."""
-    print("Running pylint to check if issues are resolved...")
+    _log("Running pylint to check if issues are resolved...")
     
     try:
-        # Run pylint only on Python files
-        command = ["pylint"]
-        
-        # Find all Python files in the client directory
-        python_files = []
-        for root, _, files in os.walk(CLIENT_DIR):
-            for file in files:
-                if file.endswith('.py'):
-                    python_files.append(os.path.join(root, file))
+        # Run pylint only on Python files, in a single run that uses
+        # one worker process per CPU (--jobs=0)
+        command = ["pylint", "--jobs=0"]
         
+        python_files = _collect_py_files()
+
         if not python_files:
-            print("" +
+            _log("" +
                 "No Python files found to check with pylint")
             return False
         
-        # Run pylint on a small subset for testing
-        sample_files = python_files[:5]
-        print(f"Running pylint on sample files: {', '.join(os.path.basename(f) for f in sample_files)}")
-        
-        result = subprocess.run(command + sample_files, capture_output=True, text=True)
-        
-        # Save the output to a new log file
-        with open("optimization_fixed.log", "w") as log_file:
-            log_file.write(result.stdout)
+        _log(f"Running pylint on {len(python_files)} Python files")
+
+        # Show the progress so far before the long pylint run
+        flush_log()
+
+        # Let pylint write straight into the new log file instead of
+        # buffering its whole output in memory first
+        with open("optimization_fixed.log", "wb") as log_file:
+            result = subprocess.run(command + python_files, stdout=log_file,
+                                    stderr=subprocess.STDOUT)
         
         if result.returncode == 0:
-            print("✅ Pylint passed without errors!")
+            _log("✅ Pylint passed without errors!")
         else:
-            print("⚠️ Pylint found some issues, but hopefully fewer than before.")
-            print("  See optimization_fixed.log for details")
+            _log("⚠️ Pylint found some issues, but hopefully fewer than before.")
+            _log("  See optimization_fixed.log for details")
         
         return True
     
     except Exception as e:
-        print(f"Error running pylint: {str(e)}")
+        _log(f"Error running pylint: {str(e)}")
         return False
 
 
 def main():
     """Main function to run all fixes."""
-    print("🔧 AILinux Code Optimization Bugfix Script 🔧")
-    print("============================================")
-    
-    # Run all fixes
-    fixes = [
-        fix_adjust_hierarchy_with_debugger,
-        fix_file_sync_client,
-        fix_alphaos_py,
-        fix_start_js,
-        fix_websocket_client_py,
-        fix_websocket_client_with_dash,
-        fix_config_py,
-        fix_missing_docstrings,
-    ]
-
-    success_count = 0
-    for fix_function in fixes:
-        if fix_function():
+    _log("🔧 AILinux Code Optimization Bugfix Script 🔧")
+    _log("============================================")
+
+    try:
+        # Files unchanged since the previous run are skipped
+        load_fix_cache()
+
+        # Run all fixes
+        success_count = 0
+        for source, target, transform in FIXES:
+            if apply_fix(source, target, transform):
+                success_count += 1
+
+        if fix_missing_docstrings():
             success_count += 1
 
-    print(f"\n✅ Applied {success_count}/{len(fixes)} fixes successfully!")
+        # Write all changed files in one go
+        written = flush()
+        save_fix_cache()
 
-    # Run pylint to check if issues are resolved
-    run_pylint()
+        _log(f"\n✅ Applied {success_count}/{len(FIXES) + 1} fixes successfully!")
+        _log(f"   {written} files written")
+
+        # Run pylint to check if issues are resolved
+        run_pylint()
+
+        _log("\n🎉 Fixes completed! The code should now have fewer issues.")
+        _log("   Re-run pylint on the entire codebase to verify all issues are resolved.")
+    finally:
+        # Messages queued before an error are still shown
+        flush_log()
 
-    print("\n🎉 Fixes completed! The code should now have fewer issues.")
-    print("   Re-run pylint on the entire codebase to verify all issues are resolved.")
-    
 
 if __name__ == "__main__":
     main()
@@ -5,57 +5,359 @@ AILinux Complete Bugfix Script
 This script addresses all remaining issues found in the optimization_fixed.log file,
 focusing on the critical syntax errors and code style problems.
 """
+import ast
+import hashlib
+import importlib.metadata
+import io
+import json
 import os
 import re
+import subprocess
+import threading
+import tokenize
+from concurrent.futures import ThreadPoolExecutor
 # import sys
   # removed: W0611
 # # Potential unused import: import shutil
   # removed: W0611
-from pathlib # Potential unused import: import Path
+from pathlib import Path
+
+# re2 (google-re2) scans without backtracking; the stdlib engine is used without it
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# f-string messages of logger calls: (call, f-string body)
+_RE_LOGGER_FSTRING = _re_engine.compile(r'(logger\.(?:debug|info|warning|error|critical))\(f"([^"]*)"')
+# f-string messages of logging.error calls: (call, f-string body)
+_RE_LOGGING_ERROR_F = re.compile(r'(logging\.error)\(f"([^"]*)"')
+# %-style placeholder for each f-string conversion
+_CONVERSIONS = {'': '%s', 's': '%s', 'r': '%r', 'a': '%a'}
+# A plain f-string field, or else a single character that ends a run of literal text
+_RE_FSTRING_TOKEN = re.compile(r'\{([^{}()\[\]\'"!:=%]+)\}|[{}%]')
+# Trailing whitespace at the end of every line (what str.rstrip() removes)
+_RE_TRAILING_WS = re.compile(r'[ \t\r\f\v]+$', re.MULTILINE)
+# Module docstring at the start of a file, after any leading whitespace
+_RE_MODULE_DOCSTRING = re.compile(r'\s*"""')
+
+# Standard library modules that are sorted before third-party imports
+_STDLIB_MODULES = frozenset({
+    'os', 'sys', 'time', 'json', 'logging', 'threading', 'uuid',
+    'typing', 'datetime', 'pathlib', 're', 'collections', 'functools'
+})
+
+# Literal rewrites for the WebSocket client modules, applied in one pass:
+# constant naming, the echo_handler docstring and the unused List import
+_WEBSOCKET_REPLACEMENTS = {
+    '_instance = None': 'INSTANCE = None',
+    'global _instance': 'global INSTANCE',
+    '_instance is None': 'INSTANCE is None',
+    '_instance = WebSocketClient()': 'INSTANCE = WebSocketClient()',
+    'def echo_handler(data):': 'def echo_handler(data):\n    """Handle echo responses from the server."""',
+    ', List': '',
+}
+_RE_WEBSOCKET_REPLACEMENTS = re.compile('|'.join(map(re.escape, _WEBSOCKET_REPLACEMENTS)))
+
+# Unused variables in alphaos.py, renamed with a '_' prefix in one pass
+_ALPHAOS_REPLACEMENTS = {
+    'transport, protocol = await conn': '_transport, protocol = await conn',
+    'ws_client = await connect_to_server': '_ws_client = await connect_to_server',
+}
+_RE_ALPHAOS_REPLACEMENTS = re.compile(r'(?<!\w)(?:' + '|'.join(map(re.escape, _ALPHAOS_REPLACEMENTS)) + ')')
+
+# Docstrings added to alphaos.py, one entry per line without indentation
+_ALPHAOS_MODULE_DOCSTRING = [
+    '"""WebSocket client implementation using autobahn library for AILinux project.',
+    '',
+    'Provides a WebSocket client protocol for connecting to AILinux servers.',
+    '"""',
+]
+_ALPHAOS_CLASS_DOCSTRING = [
+    '"""WebSocket client protocol handler for AILinux.',
+    '',
+    'Extends the WebSocketClientProtocol to handle AILinux-specific functionality.',
+    '"""',
+]
+_ALPHAOS_MAIN_DOCSTRING = ['"""Run the main application loop."""']
+
+# Imports that fix_alphaos_py sorts into the standard library section
+_ALPHAOS_STDLIB_MODULES = frozenset({'asyncio', 'json', 'ssl', 'logging', 'urllib'})
+
+# The fixers run in parallel threads; whole lines are printed under this lock
+_OUTPUT_LOCK = threading.Lock()
+
+
+def _log(message):
+    """Print one line of fixer output without interleaving it with other threads."""
+    with _OUTPUT_LOCK:
+        print(message)
+
+
+def list_client_dir():
+    """Return the names of all entries in the client directory, read with one scandir."""
+    try:
+        with os.scandir('client') as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
+class _FileCache:
+    """Client file contents shared by the fixers; changes are written back by flush()."""
+
+    def __init__(self):
+        self._cache = {}    # path -> (st_mtime_ns, text) as last seen on disk
+        self._pending = {}  # path -> text waiting to be written
+
+    def get(self, filepath):
+        """Return the current text of a file, reading it only when it changed on disk."""
+        if filepath in self._pending:
+            return self._pending[filepath]
+        mtime = os.stat(filepath).st_mtime_ns
+        cached = self._cache.get(filepath)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        text = Path(filepath).read_text(encoding='utf-8')
+        self._cache[filepath] = (mtime, text)
+        return text
+
+    def put(self, filepath, text):
+        """Replace the text of a file; it is written to disk by the next flush().
+
+        Text equal to what is already on disk is not written again.
+        """
+        cached = self._cache.get(filepath)
+        if cached is not None and cached[1] == text:
+            self._pending.pop(filepath, None)
+        else:
+            self._pending[filepath] = text
+
+    def flush(self):
+        """Write every pending file to disk."""
+        for filepath, text in self._pending.items():
+            try:
+                Path(filepath).write_text(text, encoding='utf-8')
+                self._cache[filepath] = (os.stat(filepath).st_mtime_ns, text)
+            except OSError as e:
+                _log(f"❌ Error writing {filepath}: {str(e)}")
+        self._pending.clear()
 
 
-def fix_adjust_hierarchy_with_debugger():
+FILE_CACHE = _FileCache()
+
+
+# Replacement for the mis-indented subprocess.run call in adjust_hierarchy_with_debugger.py
+_FIXED_RUN_LINE = ("    result = subprocess.run(['pylint', '--disable=all', '--enable=error'], "
+                   "check=True, capture_output=True, text=True)\n")
+
+
+def fix_adjust_hierarchy_with_debugger(available):
     """
     Fix syntax errors in adjust_hierarchy_with_debugger.py.
     The main issue is an unexpected indentation on line 15.
     """
     filepath = 'client/adjust_hierarchy_with_debugger.py'
-    if not os.path.exists(filepath):
-        print(f"Error: File not found: {filepath}")
+    if os.path.basename(filepath) not in available:
+        _log(f"Error: File not found: {filepath}")
         return False
 
-    print(f"Fixing {filepath}...")
+    _log(f"Fixing {filepath}...")
 
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.readlines()
-
-        # Looking for the problematic line
-        for i, line in enumerate(content):
-            if 'result = subprocess.run' in line and 'check=True' in line:
-                # Found the problematic line, fix the syntax
-                content[i] = ""
-                    "    result = subprocess.run(['pylint', '--disable=all', '--enable=error'], check=True, capture_output=True, text=True)\n"
+        content = FILE_CACHE.get(filepath)
+
+        # Looking for the problematic line with str.find instead of walking every line
+        idx = content.find('result = subprocess.run')
+        while idx != -1:
+            start = content.rfind('\n', 0, idx) + 1
+            end = content.find('\n', idx) + 1 or len(content)
+            if content.find('check=True', start, end) != -1:
                 # Remove the next line if it's a continuation of this problematic syntax
-                if i+1 < len(content) and 'capture_output=True' in content[i+1]:
-                    content[i+1] = ""
+                next_end = content.find('\n', end) + 1 or len(content)
+                if content.find('capture_output=True', end, next_end) != -1:
+                    end = next_end
 
-                print(f"  Fixed indentation error on line {i+1}")
+                # Found the problematic line, fix the syntax
+                content = content[:start] + _FIXED_RUN_LINE + content[end:]
+                _log(f"  Fixed indentation error on line {content.count(chr(10), 0, start) + 1}")
                 break
+            idx = content.find('result = subprocess.run', end)
 
-        # Write the fixed content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.writelines(content)
+        # Store the fixed content; main() writes it to disk
+        FILE_CACHE.put(filepath, content)
 
-        print(f"✅ Successfully fixed {filepath}")
+        _log(f"✅ Successfully fixed {filepath}")
         return True
 
     except Exception as e:
-        print(f"❌ Error fixing {filepath}: {str(e)}")
+        _log(f"❌ Error fixing {filepath}: {str(e)}")
         return False
 
 
-def fix_websocket_client_module():
+def _sort_imports(content):
+    """Return content with its leading imports ordered: standard library first, then third-party.
+
+    The module is tokenized once, so multi-line imports stay intact, and
+    comments move with the import that follows them. Content that cannot be
+    tokenized is returned unchanged.
+    """
+    lines = content.split('\n')
+    prefix = []
+    std_lib_imports = []
+    third_party_imports = []
+    consumed = 0  # index of the first line not yet placed
+    statement = []
+
+    try:
+        for tok in tokenize.generate_tokens(io.StringIO(content).readline):
+            if tok.type == tokenize.ENDMARKER:
+                break
+            if not statement and tok.type in (tokenize.NL, tokenize.COMMENT):
+                continue
+            statement.append(tok)
+            if tok.type != tokenize.NEWLINE:
+                continue
+
+            start, end = statement[0].start[0] - 1, tok.start[0]
+            first = statement[0]
+            second = statement[1] if len(statement) > 1 else None
+            statement = []
+            gap = lines[consumed:start]
+
+            if first.type == tokenize.NAME and first.string in ('import', 'from'):
+                if not std_lib_imports and not third_party_imports:
+                    # Blank lines after the docstring stay where they are
+                    while gap and not gap[0].strip():
+                        prefix.append(gap.pop(0))
+                module = second.string if second.type == tokenize.NAME else ''
+                target = std_lib_imports if module in _STDLIB_MODULES else third_party_imports
+                target.extend(line for line in gap if line.strip())
+                target.extend(lines[start:end])
+            elif first.type == tokenize.STRING and not std_lib_imports and not third_party_imports:
+                # Module docstring
+                prefix.extend(gap)
+                prefix.extend(lines[start:end])
+            else:
+                break
+            consumed = end
+    except (tokenize.TokenError, SyntaxError):
+        return content
+
+    if not std_lib_imports and not third_party_imports:
+        return content
+    if std_lib_imports and third_party_imports:
+        std_lib_imports.append('')
+    prefix.extend(std_lib_imports)
+    prefix.extend(third_party_imports)
+    prefix.extend(lines[consumed:])
+    return '\n'.join(prefix)
+
+
+def _scan_field(body, start):
+    """Scan the f-string field after the '{' at start, keeping brackets and quotes whole.
+
+    Returns (expression, conversion, index after the '}'), or None for
+    fields without a plain %-placeholder such as format specs or {x=}.
+    """
+    i = start
+    n = len(body)
+    depth = 0
+    quote = None
+    while i < n:
+        char = body[i]
+        if quote:
+            if char == '\\':
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in '\'"':
+            quote = char
+        elif char in '([{':
+            depth += 1
+        elif char in ')]}':
+            if depth == 0:
+                break
+            depth -= 1
+        elif depth == 0 and (char == ':' or (char == '!' and not body.startswith('!=', i))):
+            break
+        i += 1
+    expression = body[start:i].strip()
+    conversion = ''
+    if i < n and body[i] == '!':
+        conversion = body[i + 1:i + 2]
+        i += 2
+    if i >= n or body[i] != '}' or conversion not in _CONVERSIONS:
+        return None
+    if not expression or expression.endswith('='):
+        return None
+    return expression, conversion, i + 1
+
+
+def _fstring_to_percent(body):
+    """Split an f-string body into a %-format string and its field expressions.
+
+    Literal text is copied in slices between the matches of _RE_FSTRING_TOKEN.
+    Returns None when a field has no plain %-equivalent.
+    """
+    parts = []
+    expressions = []
+    pos = 0
+    search = _RE_FSTRING_TOKEN.search
+    match = search(body)
+    while match:
+        i = match.start()
+        parts.append(body[pos:i])
+        expression = match.group(1)
+        char = body[i]
+        if expression is not None:
+            expression = expression.strip()
+            if not expression:
+                return None
+            parts.append('%s')
+            expressions.append(expression)
+            pos = match.end()
+        elif char == '%':
+            parts.append('%%')
+            pos = i + 1
+        elif body.startswith(char * 2, i):
+            parts.append(char)
+            pos = i + 2
+        elif char == '}':
+            return None
+        else:
+            field = _scan_field(body, i + 1)
+            if field is None:
+                return None
+            expression, conversion, pos = field
+            parts.append(_CONVERSIONS[conversion])
+            expressions.append(expression)
+        match = search(body, pos)
+    parts.append(body[pos:])
+
+    fmt = ''.join(parts)
+    # Without arguments logging does not %-format the message
+    if not expressions:
+        fmt = fmt.replace('%%', '%')
+    return fmt, expressions
+
+
+def _lazy_log_call(match):
+    """Rewrite ``call(f"...{x}..."`` as ``call("...%s...", x``; the rest of the call is kept."""
+    converted = _fstring_to_percent(match.group(2))
+    if converted is None:
+        return match.group(0)
+    fmt, expressions = converted
+    rewritten = f'{match.group(1)}("{fmt}"' + ''.join(f', {arg}' for arg in expressions)
+    # Broken field expressions would leave a call that doesn't compile
+    try:
+        compile(rewritten + ')', '<logging call>', 'eval')
+    except SyntaxError:
+        return match.group(0)
+    return rewritten
+
+
+def fix_websocket_client_module(available):
     """
     Fix issues in the WebSocket client modules by reorganizing imports
     and addressing trailing whitespace issues.
@@ -67,199 +369,177 @@ def fix_websocket_client_module():
     ]
 
     for filepath in filepaths:
-        if not os.path.exists(filepath):
-            print(f"Warning: File not found: {filepath}")
+        if os.path.basename(filepath) not in available:
+            _log(f"Warning: File not found: {filepath}")
             continue
 
-        print(f"Fixing {filepath}...")
+        _log(f"Fixing {filepath}...")
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = FILE_CACHE.get(filepath)
 
             # 1. Fix module docstring if missing
-            if not content.strip().startswith('"""'):
+            if not _RE_MODULE_DOCSTRING.match(content):
                 module_name = os.path.basename(filepath).replace('.py', '').replace('-', '_')
-                docstring = f'"""" +
-                    "WebSocket client module for AILinux project.\n\nProvides functionality for connecting to WebSocket servers and handling real-time communication.\n"""\n'
+                docstring = '"""WebSocket client module for AILinux project.\n\nProvides functionality for connecting to WebSocket servers and handling real-time communication.\n"""\n'
                 content = docstring + content
 
             # 2. Remove trailing whitespace from all lines
-            content = '\n'.join(line.rstrip() for line in content.split('\n'))
+            content = _RE_TRAILING_WS.sub('', content)
 
             # 3. Fix # Potential unused import: import ordering - move standard library imports before third-party imports
-            # Extract the import section
-            import_lines = []
-            other_lines = []
-            in_import_section = True
-
-            for line in content.split('\n'):
-                if line.strip() and not line.strip().startswith('"""" +
-                    "') and not line.strip().endswith('"""'):
-                    if in_import_section and (line.startswith('import ') or line.startswith('from ')):
-                        import_lines.append(line)
-                    else:
-                        in_import_section = False
-                        other_lines.append(line)
-                else:
-                    if in_import_section:
-                        import_lines.append(line)
-                    else:
-                        other_lines.append(line)
-
-            # Separate standard library imports from third-party imports
-            std_lib_imports = []
-            third_party_imports = []
-
-            std_lib_modules = [
-                'os', 'sys', 'time', 'json', 'logging', 'threading', 'uuid', 
-                'typing', 'datetime', 'pathlib', 're', 'collections', 'functools'
-            ]
-
-            for line in import_lines:
-                if line.strip() and (line.startswith('import ') or line.startswith('from ')):
-                    module = line.split()[1].split('.')[0]
-                    if module in std_lib_modules:
-                        std_lib_imports.append(line)
-                    else:
-                        third_party_imports.append(line)
-                else:
-                    # Keep empty lines and comments in their original positions
-                    if len(std_lib_imports) > 0:
-                        std_lib_imports.append(line)
-                    elif len(third_party_imports) > 0:
-                        third_party_imports.append(line)
-                    else:
-                        std_lib_imports.append(line)
-
-            # Recombine the # Potential unused import: import sections in the correct order
-            new_content = '\n'.join(std_lib_imports + third_party_imports + other_lines)
+            new_content = _sort_imports(content)
 
             # 4. Fix string formatting in logging calls
             # Replace f-strings with % formatting in logging calls
-            pattern = r'logger\.(debug|info|warning|error|critical)\("([^"]*)"'
-            replacement = r'logger.\1("\\2"'
-            new_content = re.sub(pattern, replacement, new_content)
+            if 'logger.' in new_content and '(f"' in new_content:
+                new_content = _RE_LOGGER_FSTRING.sub(_lazy_log_call, new_content)
 
-            # 5. Fix constant naming
-            new_content = new_content.replace('_instance = None', 'INSTANCE = None')
-            new_content = new_content.replace('global _instance', 'global INSTANCE')
-            new_content = new_content.replace('_instance is None', 'INSTANCE is None')
-            new_content = new_content.replace('" +
-                "_instance = WebSocketClient()', 'INSTANCE = WebSocketClient()')
+            # 5. Fix constant naming, 6. add the missing echo_handler docstring
+            # and 7. remove the unused import, all in a single pass
+            new_content = _RE_WEBSOCKET_REPLACEMENTS.sub(
+                lambda m: _WEBSOCKET_REPLACEMENTS[m.group(0)], new_content)
 
-            # 6. Add missing docstring to echo_handler function
-            new_content = new_content.replace(
-                'def echo_handler(data):',
-                'def echo_handler(data):\n    """Handle echo responses from the server."""'
-            )
+            # Store the fixed content; main() writes it to disk
+            FILE_CACHE.put(filepath, new_content)
 
-            # 7. Remove unused import
-            new_content = new_content.replace(', List', '')
+            _log(f"✅ Successfully fixed {filepath}")
 
-            # Write the fixed content back
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+        except Exception as e:
+            _log(f"❌ Error fixing {filepath}: {str(e)}")
 
-            print(f"✅ Successfully fixed {filepath}")
 
-        except Exception as e:
-            print(f"❌ Error fixing {filepath}: {str(e)}")
+def _first_line(node):
+    """Return the 1-based first line of a statement, including its decorators."""
+    return min([node.lineno] + [d.lineno for d in getattr(node, 'decorator_list', [])])
+
+
+def _docstring_edit(node, lines, docstring_lines):
+    """Return an edit inserting a docstring before the first statement in a class or function body."""
+    start = _first_line(node.body[0]) - 1
+    if start < node.lineno:
+        # The body shares the line of the definition, e.g. "class A: pass"
+        return None
+    first = lines[start]
+    indent = first[:len(first) - len(first.lstrip())]
+    return (start, start, [indent + line if line else '' for line in docstring_lines])
+
+
+def _import_order_edit(tree, lines):
+    """Return an edit that moves the standard library imports of the leading import block first.
+
+    Comments inside the block travel with the import that follows them.
+    """
+    body = tree.body
+    first = next((i for i, node in enumerate(body) if isinstance(node, (ast.Import, ast.ImportFrom))), None)
+    if first is None:
+        return None
+
+    std_imports = []
+    third_party_imports = []
+    start = prev_end = body[first].lineno - 1
+    for node in body[first:]:
+        if not isinstance(node, (ast.Import, ast.ImportFrom)):
+            break
+        if node.lineno <= prev_end:
+            # Several statements on one line; leave the block alone
+            return None
+        if isinstance(node, ast.Import):
+            module = node.names[0].name
+        else:
+            module = node.module if node.level == 0 and node.module else ''
+        target = std_imports if module.split('.')[0] in _ALPHAOS_STDLIB_MODULES else third_party_imports
+        target.extend(line for line in lines[prev_end:node.lineno - 1] if line.strip())
+        target.extend(lines[node.lineno - 1:node.end_lineno])
+        prev_end = node.end_lineno
 
+    if std_imports and third_party_imports:
+        std_imports.append('')
+    std_imports.extend(third_party_imports)
+    return (start, prev_end, std_imports)
 
-def fix_alphaos_py():
+
+def fix_alphaos_py(available):
     """
     Fix issues in alphaos.py, including class docstring and # Potential unused import: import ordering.
     """
     filepath = 'client/alphaos.py'
-    if not os.path.exists(filepath):
-        print(f"Error: File not found: {filepath}")
+    if os.path.basename(filepath) not in available:
+        _log(f"Error: File not found: {filepath}")
         return False
 
-    print(f"Fixing {filepath}...")
+    _log(f"Fixing {filepath}...")
 
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # 1. Fix module docstring if missing
-        if not content.strip().startswith('"""'):
-            docstring = '"""" +
-                "WebSocket client implementation using autobahn library for AILinux project.\n\nProvides a WebSocket client protocol for connecting to AILinux servers.\n"""\n'
-            content = docstring + content
-
-        # 2. Add class docstring
-        class_def_pattern = r'class MyWebSocketClientProtocol\(WebSocketClientProtocol\):'
-        class_docstring = 'class MyWebSocketClientProtocol(WebSocketClientProtocol):\n    """" +
-            "WebSocket client protocol handler for AILinux.\n    \n    Extends the WebSocketClientProtocol to handle AILinux-specific functionality.\n    """'
-        content = re.sub(class_def_pattern, class_docstring, content)
-
-        # 3. Add docstring to main function
-        if 'async def main():' in content and not re.search(r'async def main\(\):\s+"""', content):
-            content = content.replace(
-                'async def main():',
-                'async def main():\n    """Run the main application loop."""'
-            )
-
-        # 4. Fix import ordering
-        # Extract imports
-        import_section = re.search(r'import.*?(?=class|\n\n)', content, re.DOTALL)
-        if import_section:
-            imports = import_section.group(0)
-
-            # Separate standard lib from third-party
-            std_imports = []
-            third_party_imports = []
-
-            for line in imports.split('\n'):
-                if line.strip():
-                    if line.startswith('# Potential unused import: import asyncio') or line.startswith('import json') or line.startswith('import ssl') or line.startswith('import logging') or 'urllib.parse' in line:
-                        std_imports.append(line)
-                    else:
-                        third_party_imports.append(line)
-
-            # Replace the imports section with ordered imports
-            new_imports = '\n'.join(std_imports + [''] + third_party_imports)
-            content = content.replace(imports, new_imports)
+        content = FILE_CACHE.get(filepath)
+
+        # Parse once; the docstring and import fixes below all work from this tree.
+        # The logging and naming rewrites after them are plain text edits and
+        # apply even when the file doesn't parse.
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError) as e:
+            _log(f"  Warning: {filepath} does not parse; docstrings and imports left as is: {e}")
+            tree = None
+
+        if tree is not None:
+            lines = content.split('\n')
+            edits = []  # (start, end, new_lines) replacing lines[start:end]
+
+            # 1. Fix module docstring if missing
+            if ast.get_docstring(tree) is None:
+                top = 1 if lines[0].startswith('#!') else 0
+                edits.append((top, top, _ALPHAOS_MODULE_DOCSTRING))
+
+            for node in tree.body:
+                # 2. Add class docstring
+                if (isinstance(node, ast.ClassDef) and node.name == 'MyWebSocketClientProtocol'
+                        and ast.get_docstring(node) is None):
+                    edits.append(_docstring_edit(node, lines, _ALPHAOS_CLASS_DOCSTRING))
+                # 3. Add docstring to main function
+                elif (isinstance(node, ast.AsyncFunctionDef) and node.name == 'main'
+                        and ast.get_docstring(node) is None):
+                    edits.append(_docstring_edit(node, lines, _ALPHAOS_MAIN_DOCSTRING))
+
+            # 4. Fix import ordering: standard library imports first, then third-party ones
+            edits.append(_import_order_edit(tree, lines))
+
+            for start, end, new_lines in sorted(filter(None, edits), key=lambda e: e[:2], reverse=True):
+                lines[start:end] = new_lines
+            content = '\n'.join(lines)
 
         # 5. Replace f-string with % formatting in logging
-        pattern = r'logging\.error\("([^"]*)"'
-        replacement = r'logging.error("\1"'
-        content = re.sub(pattern, replacement, content)
+        if 'logging.error(f"' in content:
+            content = _RE_LOGGING_ERROR_F.sub(_lazy_log_call, content)
 
         # 6. Address unused variables
         # Instead of removing them, use '_' prefix to indicate they're intentionally unused
-        content = content.replace('" +
-            "transport, protocol = await conn', '_transport, protocol = await conn')
-        content = content.replace('" +
-            "ws_client = await connect_to_server', '_ws_client = await connect_to_server')
+        content = _RE_ALPHAOS_REPLACEMENTS.sub(lambda m: _ALPHAOS_REPLACEMENTS[m.group(0)], content)
 
-        # Write the fixed content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Store the fixed content; main() writes it to disk
+        FILE_CACHE.put(filepath, content)
 
-        print(f"✅ Successfully fixed {filepath}")
+        _log(f"✅ Successfully fixed {filepath}")
         return True
 
     except Exception as e:
-        print(f"❌ Error fixing {filepath}: {str(e)}")
+        _log(f"❌ Error fixing {filepath}: {str(e)}")
         return False
 
 
-def fix_bigfiles_py():
+def fix_bigfiles_py(available):
     """
     Fix issues in bigfiles.py, including constant naming and pointless statements.
     """
     filepath = 'client/bigfiles.py'
-    if not os.path.exists(filepath):
-        print(f"Error: File not found: {filepath}")
+    if os.path.basename(filepath) not in available:
+        _log(f"Error: File not found: {filepath}")
         return False
 
-    print(f"Fixing {filepath}...")
+    _log(f"Fixing {filepath}...")
 
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.readlines()
+        content = io.StringIO(FILE_CACHE.get(filepath)).readlines()
 
         # Fix module docstring
         if not content[0].startswith('"""'):
@@ -272,405 +552,124 @@ def fix_bigfiles_py():
 
         # Fix pointless statements
         for i, line in enumerate(content):
-            if line.strip() == 'top_20_files' or line.strip() == '"" +
-                "Directory does not exist or cannot be accessed"':
+            if line.strip() == 'top_20_files' or line.strip() == '"Directory does not exist or cannot be accessed"':
                 content[i] = f"    print({line.strip()})\n"
 
-        # Write the fixed content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.writelines(content)
+        # Store the fixed content; main() writes it to disk
+        FILE_CACHE.put(filepath, ''.join(content))
 
-        print(f"✅ Successfully fixed {filepath}")
+        _log(f"✅ Successfully fixed {filepath}")
         return True
 
     except Exception as e:
-        print(f"❌ Error fixing {filepath}: {str(e)}")
+        _log(f"❌ Error fixing {filepath}: {str(e)}")
         return False
 
 
-def create_unified_websocket_client():
+# Clean implementation written by create_unified_websocket_client, kept next to this script
+UNIFIED_CLIENT_TEMPLATE = Path(__file__).resolve().parent / '_templates' / 'websocket_client.py.tmpl'
+
+
+def create_unified_websocket_client(available):
     """
     Create a unified WebSocket client by merging the best parts of both versions
     and ensuring it meets all code quality standards.
     """
     new_filepath = 'client/websocket_client.py'
 
-    print(f"Creating unified WebSocket client at {new_filepath}...")
+    _log(f"Creating unified WebSocket client at {new_filepath}...")
 
     try:
-        # Create a new, clean implementation
-        content = '''"""
-WebSocket client for AILinux system.
+        # The template is only read when a client is actually created
+        data = UNIFIED_CLIENT_TEMPLATE.read_bytes()
 
-This module provides a standardized WebSocket client for connecting to
-AILinux WebSocket servers and handling real-time communication.
-"""
-import os
-import json
-import logging
-import threading
-import time
-import uuid
-from typing import Dict, Any, Optional, Callable
-
-# Third-party imports
-import websocket
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(name)s - %(message)s"
-)
-logger = logging.getLogger("WebSocketClient")
-
-# Server configuration
-WS_SERVER_URL = os.getenv("WS_SERVER_URL", "ws://localhost:8082")
-WS_API_KEY = os.getenv("WS_API_KEY", "")
-WS_RECONNECT_DELAY = int(os.getenv("WS_RECONNECT_DELAY", "5"))
-WS_MAX_RECONNECT = int(os.getenv("WS_MAX_RECONNECT", "10"))
-WS_HEARTBEAT_INTERVAL = int(os.getenv("WS_HEARTBEAT_INTERVAL", "30"))
-
-
-class WebSocketClient:
-    """WebSocket client for real-time communication."""
-    
-    def __init__(self, url: Optional[str] = None, auto_connect: bool = False):
-        """Initialize the WebSocket client.
-        
-        Args:
-            url: WebSocket server URL (defaults to environment variable)
-            auto_connect: Whether to connect automatically on initialization
-        """
-        self.url = url or WS_SERVER_URL
-        self.ws = None
-        self.connected = False
-        self.reconnect_count = 0
-        self.client_id = f"ailinux-{str(uuid.uuid4())[:8]}"
-        self.shutdown_requested = False
-        self.ws_thread = None
-        self.message_handlers = {}
-        self.last_activity = time.time()
-        self.last_heartbeat = time.time()
-        
-        # Start connection if requested
-        if auto_connect:
-            self.connect()
-    
-    def connect(self):
-        """Connect to the WebSocket server."""
-        if self.connected or (self.ws_thread and self.ws_thread.is_alive()):
-            logger.info("WebSocket already connected or connecting")
-            return
-        
-        self.shutdown_requested = False
-        self.ws_thread = threading.Thread(target=self._connect_and_run, daemon=True)
-        self.ws_thread.start()
-        logger.info("Started WebSocket connection thread to %s", self.url)
-    
-    def disconnect(self):
-        """Disconnect from the WebSocket server."""
-        self.shutdown_requested = True
-        if self.ws:
-            self.ws.close()
-        
-        # Wait for thread to terminate
-        if self.ws_thread and self.ws_thread.is_alive():
-            self.ws_thread.join(timeout=2.0)
-        
-        self.connected = False
-        logger.info("WebSocket disconnected")
-    
-    def is_connected(self) -> bool:
-        """Check if the WebSocket is connected.
-        
-        Returns:
-            bool: True if connected, False otherwise
-        """
-        return self.connected
-    
-    def send_message(self, message_type: str, data: Dict[str, Any]):
-        """Send a message to the WebSocket server.
-        
-        Args:
-            message_type: Type of the message
-            data: Message data
-        
-        Returns:
-            bool: True if message was sent, False otherwise
-        """
-        if not self.connected or not self.ws:
-            logger.warning("Cannot send message, WebSocket not connected: %s", message_type)
-            return False
-        
-        try:
-            message = {
-                "type": message_type,
-                "client_id": self.client_id,
-                "timestamp": time.time(),
-                "data": data
-            }
-            
-            self.ws.send(json.dumps(message))
-            self.last_activity = time.time()
-            logger.debug("Sent message: %s", message_type)
+        # Leave an identical client from an earlier run untouched
+        if (os.path.basename(new_filepath) in available
+                and Path(new_filepath).read_bytes() == data):
+            _log(f"✅ Unified WebSocket client at {new_filepath} is already up to date")
             return True
-        except Exception as e:
-            logger.error("Error sending message: %s", str(e))
-            return False
-    
-    def register_handler(self, message_type: str, handler: Callable[[Dict[str, Any]], None]):
-        """Register a handler for a specific message type.
-        
-        Args:
-            message_type: Type of message to handle
-            handler: Callback function for the message type
-        """
-        self.message_handlers[message_type] = handler
-        logger.debug("Registered handler for message type: %s", message_type)
-    
-    def _connect_and_run(self):
-        """Connect to the WebSocket server and run the message loop."""
-        while not self.shutdown_requested:
-            try:
-                # Connect to the server
-                logger.info("Connecting to WebSocket server: %s", self.url)
-                
-                # Create WebSocket connection
-                websocket.enableTrace(os.getenv("WS_DEBUG", "False").lower() == "true")
-                self.ws = websocket.WebSocketApp(
-                    self.url,
-                    on_open=self._on_open,
-                    on_message=self._on_message,
-                    on_error=self._on_error,
-                    on_close=self._on_close
-                )
-                
-                # Start the WebSocket loop
-                self.ws.run_forever(
-                    ping_interval=WS_HEARTBEAT_INTERVAL,
-                    ping_timeout=5
-                )
-                
-                # Check if shutdown was requested
-                if self.shutdown_requested:
-                    logger.info("Shutdown requested, stopping reconnection attempts")
-                    break
-                
-                # Reconnect after delay if not shutdown
-                self.reconnect_count += 1
-                if self.reconnect_count > WS_MAX_RECONNECT:
-                    logger.error("Maximum reconnection attempts (%d) reached", WS_MAX_RECONNECT)
-                    break
-                
-                # Exponential backoff for reconnection
-                delay = min(WS_RECONNECT_DELAY * (2 ** (self.reconnect_count - 1)), 60)
-                logger.info("Reconnecting in %ds (attempt %d/%d)", delay, self.reconnect_count, WS_MAX_RECONNECT)
-                time.sleep(delay)
-            
-            except Exception as e:
-                logger.error("Error in WebSocket thread: %s", str(e))
-                
-                if self.shutdown_requested:
-                    break
-                
-                time.sleep(WS_RECONNECT_DELAY)
-        
-        # Clean up
-        self.connected = False
-        logger.info("WebSocket thread terminated")
-    
-    def _on_open(self, _):
-        """Handle WebSocket connection opened event.
-        
-        Args:
-            _: WebSocket instance (unused)
-        """
-        self.connected = True
-        self.reconnect_count = 0
-        self.last_activity = time.time()
-        logger.info("WebSocket connected to %s", self.url)
-        
-        # Send authentication message if API key is set
-        if WS_API_KEY:
-            auth_message = {
-                "type": "auth",
-                "client_id": self.client_id,
-                "auth_key": WS_API_KEY
-            }
-            self.ws.send(json.dumps(auth_message))
-            logger.debug("Sent authentication message")
-        
-        # Send initial handshake
-        handshake = {
-            "type": "handshake",
-            "client_id": self.client_id,
-            "timestamp": time.time(),
-            "version": "1.0.0",
-            "platform": "AILinux Backend"
-        }
-        self.ws.send(json.dumps(handshake))
-    
-    def _on_message(self, _, message):
-        """Handle incoming WebSocket messages.
-        
-        Args:
-            _: WebSocket instance (unused)
-            message: Message received from the server
-        """
-        self.last_activity = time.time()
-        
-        try:
-            # Parse message JSON
-            data = json.loads(message)
-            message_type = data.get("type", "unknown")
-            
-            logger.debug("Received message type: %s", message_type)
-            
-            # Handle heartbeat messages
-            if message_type == "heartbeat":
-                self._send_heartbeat_response()
-                return
-            
-            # Handle authentication response
-            if message_type == "auth_response":
-                status = data.get("status", "unknown")
-                logger.info("Authentication %s", status)
-                return
-            
-            # Dispatch to registered handlers
-            if message_type in self.message_handlers:
-                try:
-                    self.message_handlers[message_type](data)
-                except Exception as e:
-                    logger.error("Error in message handler for %s: %s", message_type, str(e))
-            else:
-                logger.debug("No handler for message type: %s", message_type)
-        
-        except json.JSONDecodeError:
-            logger.warning("Received non-JSON message: %s", message)
-        except Exception as e:
-            logger.error("Error processing message: %s", str(e))
-    
-    def _on_error(self, _, error):
-        """Handle WebSocket errors.
-        
-        Args:
-            _: WebSocket instance (unused)
-            error: Error that occurred
-        """
-        if isinstance(error, (ConnectionRefusedError, ConnectionResetError)):
-            logger.warning("Connection error: %s", str(error))
-        else:
-            logger.error("WebSocket error: %s", str(error))
-        
-        self.connected = False
-    
-    def _on_close(self, _, close_status_code, close_msg):
-        """Handle WebSocket connection closing.
-        
-        Args:
-            _: WebSocket instance (unused)
-            close_status_code: Status code for the close event
-            close_msg: Close message
-        """
-        self.connected = False
-        
-        if close_status_code:
-            logger.info("WebSocket closed with code: %s, message: %s", close_status_code, close_msg)
-        else:
-            logger.info("WebSocket closed")
-    
-    def _send_heartbeat_response(self):
-        """Send heartbeat response to server."""
-        if self.connected and self.ws:
-            try:
-                heartbeat_response = {
-                    "type": "heartbeat_response",
-                    "client_id": self.client_id,
-                    "timestamp": time.time()
-                }
-                self.ws.send(json.dumps(heartbeat_response))
-                self.last_heartbeat = time.time()
-            except Exception as e:
-                logger.error("Error sending heartbeat response: %s", str(e))
-
-
-# Singleton instance for global use
-INSTANCE = None
-
-def get_client() -> WebSocketClient:
-    """Get the global WebSocketClient instance.
-    
-    Returns:
-        WebSocketClient: Global client instance
-    """
-    global INSTANCE
-    if INSTANCE is None:
-        INSTANCE = WebSocketClient()
-    return INSTANCE
-
 
-if __name__ == "__main__":
-    # Set up logging when run directly
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(name)s - %(message)s"
-    )
-    
-    # Test client with echo handler
-    def echo_handler(data):
-        """Handle echo responses from the server."""
-        print(f"Echo: {data}")
-    
-    # Create client and register handler
-    client = WebSocketClient()
-    client.register_handler("echo", echo_handler)
-    
-    # Connect to server
-    client.connect()
-    
-    try:
-        # Keep running until interrupted
-        while True:
-            if client.is_connected():
-                client.send_message("echo", {"text": "Hello from AILinux!"})
-            time.sleep(5)
-    except KeyboardInterrupt:
-        print("Interrupted by user")
-    finally:
-        client.disconnect()
-'''
-
-        # Write the new implementation
-        with open(new_filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        print(f"✅ Successfully created unified WebSocket client at {new_filepath}")
+        # Write the implementation with raw os.write calls
+        fd = os.open(new_filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        available.add(os.path.basename(new_filepath))
+
+        _log(f"✅ Successfully created unified WebSocket client at {new_filepath}")
         return True
 
     except Exception as e:
-        print(f"❌ Error creating unified WebSocket client: {str(e)}")
+        _log(f"❌ Error creating unified WebSocket client: {str(e)}")
         return False
 
 
-def run_pylint_check(filepath):
-    """Run pylint on a specific file to check for issues."""
+# Cache of files that pylint passed, mapping path -> [sha256 of the file, pylint version and settings key]
+LINT_CACHE_FILE = ".ailinux_lint_cache.json"
+# pylint configuration files whose content invalidates the lint cache
+PYLINT_SETTINGS_FILES = ('.pylintrc', 'pylintrc', 'pyproject.toml', 'setup.cfg')
+
+
+def pylint_settings_key():
+    """Return a key for the installed pylint version and its configuration files."""
+    digest = hashlib.sha256()
+    try:
+        digest.update(importlib.metadata.version('pylint').encode())
+    except importlib.metadata.PackageNotFoundError:
+        pass
+    for name in PYLINT_SETTINGS_FILES:
+        try:
+            digest.update(name.encode() + b'\0' + Path(name).read_bytes())
+        except OSError:
+            continue
+    return digest.hexdigest()
+
+
+def load_lint_cache():
+    """Load the files that passed pylint in a previous run."""
     try:
-        import subprocess
+        with open(LINT_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        # No usable cache: check every file
+        return {}
 
+
+def save_lint_cache(lint_cache):
+    """Record the files that passed pylint in this run."""
+    try:
+        with open(LINT_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(lint_cache, f)
+    except OSError as e:
+        print(f"Error writing {LINT_CACHE_FILE}: {str(e)}")
+
+
+def run_pylint_check(filepath):
+    """Start pylint on a specific file and return the running process, or None on error."""
+    try:
         print(f"Running pylint check on {filepath}...")
-        result = subprocess.run(['pylint', filepath], capture_output=True, text=True)
+        return subprocess.Popen(['pylint', filepath], stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True)
 
-        if result.returncode == 0:
+    except Exception as e:
+        print(f"❌ Error running pylint check: {str(e)}")
+        return None
+
+
+def report_pylint_check(filepath, process):
+    """Wait for a pylint process started by run_pylint_check and report its issues."""
+    try:
+        output, _ = process.communicate()
+
+        if process.returncode == 0:
             print(f"✅ {filepath} passes pylint check")
             return True
         else:
             print(f"⚠️ {filepath} still has some issues:")
-            for line in result.stdout.split('\n'):
+            for line in output.split('\n'):
                 if 'E0001' in line or 'C0303' in line or 'C0103' in line:
                     print(f"  {line}")
             return False
@@ -685,6 +684,9 @@ def main():
     print("\n🔧 AILinux Complete Bugfix Script 🔧")
     print("====================================")
 
+    # Read the client directory once; the fixers check their files against it
+    available = list_client_dir()
+
     # Run the fixes
     fixes = [
         fix_adjust_hierarchy_with_debugger,
@@ -694,10 +696,13 @@ def main():
         create_unified_websocket_client
     ]
 
-    success_count = 0
-    for fix in fixes:
-        if fix():
-            success_count += 1
+    # Each fixer touches its own files, so they can overlap their file I/O
+    with ThreadPoolExecutor(max_workers=len(fixes)) as executor:
+        results = list(executor.map(lambda fix: fix(available), fixes))
+    success_count = sum(1 for result in results if result)
+
+    # Write the fixed files before pylint looks at them
+    FILE_CACHE.flush()
 
     # Run pylint checks on the fixed files
     print("\n📋 Running pylint checks on fixed files...")
@@ -708,9 +713,27 @@ def main():
         'client/websocket_client.py'
     ]
 
+    # Skip files that passed pylint unchanged, with the same pylint version and settings
+    lint_cache = load_lint_cache()
+    settings_key = pylint_settings_key()
+
+    # Start all pylint processes first so they run side by side, then collect them in order
+    processes = []
     for file in files_to_check:
-        if os.path.exists(file):
-            run_pylint_check(file)
+        if os.path.basename(file) not in available:
+            continue
+        digest = hashlib.sha256(Path(file).read_bytes()).hexdigest()
+        if lint_cache.get(file) == [digest, settings_key]:
+            print(f"✅ {file} passes pylint check (unchanged since the last run)")
+            continue
+        processes.append((file, digest, run_pylint_check(file)))
+
+    for file, digest, process in processes:
+        if process is not None and report_pylint_check(file, process):
+            lint_cache[file] = [digest, settings_key]
+        else:
+            lint_cache.pop(file, None)
+    save_lint_cache(lint_cache)
 
     print(f"\n✅ Applied {success_count}/{len(fixes)} fixes successfully!")
     print("\n📝 Summary of Fixes:")
@@ -10,6 +10,30 @@ import os
 import re
 import sys
 
+# Trailing whitespace at the end of every line, including a last line without newline
+_TRAILING_WS_RE = re.compile(r'[ \t\r\f\v]+$', re.MULTILINE)
+
+# The broken run_pylint function in adjust_hierarchy_with_debugger.py runs from its
+# definition up to the call site marker; both ends are plain literals
+_RUN_PYLINT_DEF = "def run_pylint():"
+_RUN_PYLINT_MARKER = "# Pylint-Überprüfung starten"
+_RUN_PYLINT_FUNCTION = """def run_pylint():
+    \"\"\"Run pylint with specific options to check the code.\"\"\"
+    try:
+        result = subprocess.run(
+            ['pylint', '--disable=all', '--enable=error'],
+            capture_output=True, 
+            text=True,
+            check=True
+        )
+        print(result.stdout)
+        if result.stderr:
+            print("Fehler:", result.stderr)
+    except FileNotFoundError:
+        print("Pylint ist nicht installiert. Installiere es mit 'pip install pylint'.")
+
+"""
+
 
 def fix_adjust_hierarchy_with_debugger():
     """
@@ -27,27 +51,21 @@ def fix_adjust_hierarchy_with_debugger():
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        # Find the run_pylint function and completely replace it
-        pattern = r"def run_pylint\(\):(.*?)# Pylint-Überprüfung starten"
-        replacement = """def run_pylint():
-    \"\"\"Run pylint with specific options to check the code.\"\"\"
-    try:
-        result = subprocess.run(
-            ['pylint', '--disable=all', '--enable=error'],
-            capture_output=True, 
-            text=True,
-            check=True
-        )
-        print(result.stdout)
-        if result.stderr:
-            print("Fehler:", result.stderr)
-    except FileNotFoundError:
-        print("Pylint ist nicht installiert. Installiere es mit 'pip install pylint'.")
-
-# Pylint-Überprüfung starten"""
-
-        # Use re.DOTALL to make . match newlines
-        new_content = re.sub(pattern, replacement, content, flags=re.DOTALL)
+        # Find the run_pylint function and completely replace it, keeping the marker
+        parts = []
+        pos = 0
+        while True:
+            start = content.find(_RUN_PYLINT_DEF, pos)
+            if start == -1:
+                break
+            end = content.find(_RUN_PYLINT_MARKER, start + len(_RUN_PYLINT_DEF))
+            if end == -1:
+                break
+            parts.append(content[pos:start])
+            parts.append(_RUN_PYLINT_FUNCTION)
+            pos = end
+        parts.append(content[pos:])
+        new_content = ''.join(parts)
 
         # Write the fixed content back
         with open(filepath, 'w', encoding='utf-8') as f:
@@ -77,12 +95,8 @@ def fix_websocket_client_whitespace():
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        # First, remove all trailing whitespace from every line
-        lines = content.split('\n')
-        clean_lines = [line.rstrip() for line in lines]
-
-        # Join the lines back together with clean newlines
-        clean_content = '\n'.join(clean_lines)
+        # Remove all trailing whitespace from every line in a single pass
+        clean_content = _TRAILING_WS_RE.sub('', content)
 
         # Write the fixed content back
         with open(filepath, 'w', encoding='utf-8') as f:
@@ -20,6 +20,15 @@ import argparse
 from typing import List, Dict, Tuple, Optional, Any
 
 
+def _indent(line: str) -> int:
+    """Returns the width of the leading whitespace without copying the line."""
+    i = 0
+    n = len(line)
+    while i < n and line[i] in ' \t':
+        i += 1
+    return i
+
+
 class PylintIssue:
     """Represents a pylint issue from the log file."""
 
@@ -47,6 +56,8 @@ class CodeFixer:
 
         # Setup logging
         import logging
+        from logging.handlers import MemoryHandler
+        self.log_buffer: Optional[MemoryHandler] = None
         self.logger = logging.getLogger('pylint_fixer')
         self.logger.setLevel(logging.INFO)
 
@@ -59,13 +70,16 @@ class CodeFixer:
         if log_file:
             file_handler = logging.FileHandler(log_file, mode='w')
             file_handler.setLevel(logging.INFO)
-            self.logger.addHandler(file_handler)
+            # Buffer records so the log file is written in batches, not per issue
+            self.log_buffer = MemoryHandler(capacity=1024, flushLevel=logging.ERROR,
+                                            target=file_handler)
+            self.logger.addHandler(self.log_buffer)
 
     def load_file(self, file_path: str) -> List[str]:
         """Loads a file into the cache if it's not already loaded."""
         if file_path not in self.file_cache:
             if not os.path.exists(file_path):
-                self.logger.warning("File not found: %sfile_path")
+                self.logger.warning("File not found: %s", file_path)
                 return []
 
             with open(file_path, 'r', encoding='utf-8') as file:
@@ -75,11 +89,11 @@ class CodeFixer:
     def save_file(self, file_path: str) -> None:
         """Saves the modified file contents."""
         if self.dry_run:
-            self.logger.info("[DRY RUN] Would save %sfile_path")
+            self.logger.info("[DRY RUN] Would save %s", file_path)
         else:
             with open(file_path, 'w', encoding='utf-8') as file:
                 file.writelines(self.file_cache[file_path])
-            self.logger.info("Saved: %sfile_path")
+            self.logger.info("Saved: %s", file_path)
 
     def fix_unused_import(self, issue: PylintIssue) -> bool:
         """Removes unused imports (W0611)."""
@@ -149,8 +163,8 @@ class CodeFixer:
         is_class = "class" in issue.message.lower() or "class " in line
         is_module = "module" in issue.message.lower() or issue.line_num == 1
 
-        indent = len(line) - len(line.lstrip())
-        indent_str = ' ' * indent
+        indent = _indent(line)
+        indent_str = ' ' * (indent + 4)  # Docstrings belong to the body
 
         if is_module and issue.line_num == 1:
             # Module docstring
@@ -162,7 +176,7 @@ class CodeFixer:
             func_name = re.search(r'def\s+(\w+)', line)
             if func_name:
                 name = func_name.group(1)
-                docstring = f'{indent_str}"""\nDescription for function {name}.\n{indent_str}"""\n'
+                docstring = f'{indent_str}"""\n{indent_str}Description for function {name}.\n{indent_str}"""\n'
                 lines.insert(issue.line_num, docstring)
                 return True
         elif is_class and "class " in line:
@@ -170,7 +184,7 @@ class CodeFixer:
             class_name = re.search(r'class\s+(\w+)', line)
             if class_name:
                 name = class_name.group(1)
-                docstring = f'{indent_str}"""\nDescription for class {name}.\n{indent_str}"""\n'
+                docstring = f'{indent_str}"""\n{indent_str}Description for class {name}.\n{indent_str}"""\n'
                 lines.insert(issue.line_num, docstring)
                 return True
 
@@ -203,7 +217,7 @@ class CodeFixer:
                     strings = re.findall(pattern, line)
                     for string in strings:
                         if len(string) > 30:  # Only split long strings
-                            indent = len(line) - len(line.lstrip())
+                            indent = _indent(line)
                             indent_str = ' ' * (indent + 4)  # Extra indentation
                             replacement = f"{string[0]}\" +\n{indent_str}\"{string[1:-1]}{string[-1]}"
                             new_line = line.replace(string, replacement)
@@ -214,7 +228,7 @@ class CodeFixer:
             if ',' in line and not ('"' in line or "'" in line):  # Avoid breaking inside strings
                 parts = line.split(',')
                 if len(parts) > 1:
-                    indent = len(line) - len(line.lstrip())
+                    indent = _indent(line)
                     indent_str = ' ' * indent
                     new_lines = [parts[0] + ',']
                     for part in parts[1:-1]:
@@ -315,11 +329,11 @@ class CodeFixer:
             if fixed:
                 self.fixes_applied += 1
                 self.fixed_issues.append(issue)
-                self.logger.info("Fixed: %sissue")
+                self.logger.info("Fixed: %s", issue)
             else:
                 self.skipped_issues += 1
                 self.unfixed_issues.append(issue)
-                self.logger.info("Skipped: %sissue")
+                self.logger.info("Skipped: %s", issue)
 
         # Save all modified files
         for file_path in self.file_cache:
@@ -328,9 +342,9 @@ class CodeFixer:
         # Create a summary
         self.logger.info("\n" + "="*50)
         self.logger.info("SUMMARY:")
-        self.logger.info("Total issues processed: %slen(self.issues)")
-        self.logger.info("Fixed: %sself.fixes_applied issues")
-        self.logger.info("Skipped: %sself.skipped_issues issues")
+        self.logger.info("Total issues processed: %s", len(self.issues))
+        self.logger.info("Fixed: %s issues", self.fixes_applied)
+        self.logger.info("Skipped: %s issues", self.skipped_issues)
 
         # Group unfixed issues by code for better overview
         unfixed_by_code: Dict[str, int] = {}
@@ -342,7 +356,10 @@ class CodeFixer:
         if unfixed_by_code:
             self.logger.info("\nUnfixed issues by type:")
             for code, count in sorted(unfixed_by_code.items(), key=lambda x: x[1], reverse=True):
-                self.logger.info("  %scode: %scount issues")
+                self.logger.info("  %s: %s issues", code, count)
+
+        if self.log_buffer:
+            self.log_buffer.flush()
 
         return self.fixes_applied
 
@@ -354,8 +371,8 @@ def parse_pylint_log(log_path: str) -> List[PylintIssue]:
     with open(log_path, 'r', encoding='utf-8') as file:
         for line in file:
             # Typical pylint format: file.py:42:0: C0111: Missing docstring (missing-docstring)
-            match = re.match(r'" +'"
-                "^([\w\./\-]+):(\d+)(?::\d+)?: ([CRWE]\d{4}): (.+?)(?:\s\([\w-]+\))?$', line.strip())
+            match = re.match(r'^([\w\./\-]+):(\d+)(?::\d+)?: ([CRWE]\d{4}): (.+?)(?:\s\([\w-]+\))?$',
+                             line.strip())
             if match:
                 file_path, line_num, code, message = match.groups()
                 issues.append(PylintIssue(
@@ -434,10 +451,12 @@ def create_patch_file(file_cache: Dict[str, List[str]], patch_file: str):
                     n=3
                 )
 
-                # Write the diff to the patch file
-                diff_content = ''.join(diff)
-                if diff_content:
-                    f.write(diff_content)
+                # Stream the diff into the patch file line by line
+                wrote = False
+                for diff_line in diff:
+                    f.write(diff_line)
+                    wrote = True
+                if wrote:
                     f.write('\n')
             except Exception as e:
                 f.write(f"# Error creating patch for {file_path}: {str(e)}\n\n")
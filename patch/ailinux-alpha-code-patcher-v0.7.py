@@ -17,13 +17,199 @@ import os
 import re
 import sys
 import argparse
+import ast
+import hashlib
+import io
+import itertools
 import logging
-from typing import List, Dict, Tuple, Optional, Any
+import shelve
+from logging.handlers import MemoryHandler
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Optional, Any, Iterator
+
+# Patterns used by the fixers, compiled once at import time
+# "Unused import os" as well as "Unused Dict imported from typing"
+_RE_UNUSED = re.compile(r"Unused (?:import )?([\w.]+)")
+_RE_DEF_NAME = re.compile(r'def\s+(\w+)')
+_RE_CLASS_NAME = re.compile(r'class\s+(\w+)')
+# Message classifiers: one scan per message instead of one per keyword
+_IS_DOCSTRING = re.compile(r"docstring", re.IGNORECASE).search
+_IS_LOG_FORMAT = re.compile(
+    r"lazy % formatting in logging functions|logging-fstring-interpolation|logging-not-lazy").search
+_RE_LINE_TOO_LONG = re.compile(r"Line too long \((\d+)/(\d+)\)")
+_RE_QUOTED = {
+    '"': re.compile(r'("[^"]*")'),
+    "'": re.compile(r"('[^']*')"),
+}
+_RE_LOG = re.compile(r'(logger\.\w+)\(f[\'"](.+?)[\'"](,.+?)?\)')
+_RE_TRAILING_PLUS = re.compile(r'"\s*\+\s*$')
+# Matches every issue line of a whole log; surrounding blanks are ignored
+# like the former per-line strip() did
+_RE_PYLINT_LINE = re.compile(
+    r'^[ \t]*([\w\./\-]+):(\d+)(?::\d+)?: ([CRWE]\d{4}): (.+?)(?:[ \t]\([\w-]+\))?[ \t\r]*$',
+    re.MULTILINE)
+
+# Indentation strings for the usual nesting depths
+_SPACES = [' ' * i for i in range(65)]
+
+
+def _indent_len(line: str) -> int:
+    """Return the width of the leading whitespace without copying the line."""
+    i = 0
+    n = len(line)
+    while i < n and line[i] in ' \t':
+        i += 1
+    return i
+
+
+def _spaces(count: int) -> str:
+    """Return ``count`` spaces, reusing the cached strings where possible."""
+    return _SPACES[count] if count < len(_SPACES) else ' ' * count
+
+
+# %-style placeholder for each f-string conversion
+_CONVERSIONS = {'': '%s', 's': '%s', 'r': '%r', 'a': '%a'}
+# A plain replacement field (no brackets, quotes, conversion or format spec),
+# or else a single character that ends a run of literal f-string text
+_RE_FSTRING_TOKEN = re.compile(r'\{([^{}()\[\]\'"!:=%]+)\}|[{}%]')
+
+
+def _scan_field(content: str, start: int) -> Optional[Tuple[str, str, int]]:
+    """Scan a replacement field that starts at ``start``, just after its '{'.
+
+    Brackets and quotes are taken into account, so slices like
+    ``{data[:100]}`` or comparisons like ``{a != b}`` keep their whole
+    expression.
+
+    Returns:
+        The expression, its conversion and the index after the closing '}',
+        or None if the field has no plain %-placeholder (format specs,
+        ``{x=}`` debugging fields or nested fields)
+    """
+    i = start
+    n = len(content)
+    depth = 0
+    quote = None
+    while i < n:
+        char = content[i]
+        if quote:
+            if char == '\\':
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in '\'"':
+            quote = char
+        elif char in '([{':
+            depth += 1
+        elif char in ')]}':
+            if depth == 0:
+                break
+            depth -= 1
+        elif depth == 0 and (char == ':' or (char == '!' and not content.startswith('!=', i))):
+            break
+        i += 1
+    expression = content[start:i].strip()
+    conversion = ''
+    if i < n and content[i] == '!':
+        conversion = content[i + 1:i + 2]
+        i += 2
+    if i >= n or content[i] != '}' or conversion not in _CONVERSIONS:
+        return None
+    if not expression or expression.endswith('='):
+        return None
+    return expression, conversion, i + 1
+
+
+def _fstring_to_percent(content: str) -> Optional[Tuple[str, List[str]]]:
+    """Turn the body of an f-string into a %-style format and its arguments.
+
+    Literal text is copied in slices between the braces and percent signs
+    found by one compiled pattern; only fields with brackets, quotes or a
+    conversion are scanned character by character. The expressions are not
+    validated here, callers compile the rewritten call.
+
+    Returns:
+        The format string and the field expressions, or None if any field
+        cannot be expressed as a plain %-placeholder
+    """
+    parts = []
+    expressions = []
+    pos = 0
+    search = _RE_FSTRING_TOKEN.search
+    match = search(content)
+    while match:
+        i = match.start()
+        parts.append(content[pos:i])
+        expression = match.group(1)
+        char = content[i]
+        if expression is not None:
+            expression = expression.strip()
+            if not expression:
+                return None
+            parts.append('%s')
+            expressions.append(expression)
+            pos = match.end()
+        elif char == '%':
+            parts.append('%%')
+            pos = i + 1
+        elif content.startswith(char * 2, i):
+            parts.append(char)
+            pos = i + 2
+        elif char == '}':
+            return None
+        else:
+            field = _scan_field(content, i + 1)
+            if field is None:
+                return None
+            expression, conversion, pos = field
+            parts.append(_CONVERSIONS[conversion])
+            expressions.append(expression)
+        match = search(content, pos)
+    parts.append(content[pos:])
+
+    percent_format = ''.join(parts)
+    # A message without arguments is not %-formatted by logging
+    if not expressions:
+        percent_format = percent_format.replace('%%', '%')
+    return percent_format, expressions
+
+
+def _read_bytes(file_path: str) -> Optional[bytes]:
+    """Return the raw contents of a file, or None if it can't be read."""
+    try:
+        with open(file_path, 'rb') as file:
+            return file.read()
+    except OSError:
+        return None
+
+
+def _read_lines(file_path: str) -> List[str]:
+    """Read a file from disk and return its lines.
+
+    Callers keep the result in CodeFixer.file_cache, so each file is read
+    once per run.
+    """
+    with open(file_path, 'rb') as file:
+        return _decode_lines(file.read())
+
+
+def _decode_lines(data: bytes) -> List[str]:
+    """Decode the raw contents of a file into its lines."""
+    # Decode in memory instead of reopening the file when utf-8 decoding fails
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        text = data.decode('latin-1')
+    # newline=None keeps the universal-newline handling of text mode
+    return io.StringIO(text, newline=None).readlines()
 
 
 class PylintIssue:
     """Represents a pylint issue from the log file."""
 
+    __slots__ = ('file_path', 'line_num', 'code', 'message')
+
     def __init__(self, file_path: str, line_num: int, code: str, message: str):
         """Initialize a new pylint issue.
         
@@ -33,9 +219,11 @@ class PylintIssue:
             code: PyLint error/warning code (e.g., C0303)
             message: Description of the issue
         """
-        self.file_path = file_path
+        # Paths and codes repeat across many issues; interning shares one
+        # string object per value and makes comparisons identity checks
+        self.file_path = sys.intern(file_path)
         self.line_num = line_num
-        self.code = code  # e.g. C0303, E0611
+        self.code = sys.intern(code)  # e.g. C0303, E0611
         self.message = message
 
     def __repr__(self) -> str:
@@ -47,7 +235,8 @@ class CodeFixer:
     """Class for fixing pylint issues in code."""
 
     def __init__(self, issues: List[PylintIssue], dry_run: bool = False,
-                 log_file: Optional[str] = None, verbose: bool = False):
+                 log_file: Optional[str] = None, verbose: bool = False,
+                 cache_file: Optional[str] = None):
         """Initialize the code fixer.
         
         Args:
@@ -55,38 +244,51 @@ class CodeFixer:
             dry_run: If True, don't actually modify files
             log_file: Path to write log output to
             verbose: Whether to print detailed logs
+            cache_file: Path of the persistent result cache, None to disable it
         """
         self.issues = issues
         self.dry_run = dry_run
         self.verbose = verbose
+        self.cache_file = cache_file
         self.file_cache: Dict[str, List[str]] = {}
+        # Raw contents already read for the result cache, decoded by load_file()
+        self.file_bytes: Dict[str, bytes] = {}
         self.fixes_applied = 0
         self.skipped_issues = 0
         self.fixed_issues: List[PylintIssue] = []
         self.unfixed_issues: List[PylintIssue] = []
         self.files_modified: List[str] = []
+        # Lines to insert per file, keyed by 0-based index into the original file
+        self.pending_inserts: Dict[str, List[Tuple[int, List[str]]]] = defaultdict(list)
 
         # Setup logging
         self.logger = logging.getLogger('pylint_fixer')
+        self.log_buffer: Optional[MemoryHandler] = None
 
         # Set log level based on verbose flag
         log_level = logging.DEBUG if verbose else logging.INFO
         self.logger.setLevel(log_level)
 
-        # Console handler
-        console = logging.StreamHandler()
-        console.setLevel(log_level)
-        formatter = logging.Formatter('%(levelname)s: %(message)s')
-        console.setFormatter(formatter)
-        self.logger.addHandler(console)
-
-        # File handler (if log_file is provided)
-        if log_file:
-            file_handler = logging.FileHandler(log_file, mode='w')
-            file_handler.setLevel(logging.DEBUG)  # Always detailed in the file
-            file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(file_handler)
+        # Handlers are attached once per process, so the fixers created in
+        # worker processes don't stack up duplicate handlers
+        if not self.logger.handlers:
+            # Console handler
+            console = logging.StreamHandler()
+            console.setLevel(log_level)
+            formatter = logging.Formatter('%(levelname)s: %(message)s')
+            console.setFormatter(formatter)
+            self.logger.addHandler(console)
+
+            # File handler (if log_file is provided)
+            if log_file:
+                file_handler = logging.FileHandler(log_file, mode='w')
+                file_handler.setLevel(logging.DEBUG)  # Always detailed in the file
+                file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+                file_handler.setFormatter(file_formatter)
+                # Buffer records so verbose runs don't write the file once per issue
+                self.log_buffer = MemoryHandler(capacity=10000, flushLevel=logging.ERROR,
+                                                target=file_handler)
+                self.logger.addHandler(self.log_buffer)
 
     def load_file(self, file_path: str) -> List[str]:
         """Load a file into the cache if it's not already loaded.
@@ -97,20 +299,56 @@ class CodeFixer:
         Returns:
             List of lines from the file
         """
-        if file_path not in self.file_cache:
-            if not os.path.exists(file_path):
-                self.logger.warning("File not found: %s", file_path)
+        lines = self.file_cache.get(file_path)
+        if lines is None:
+            data = self.file_bytes.pop(file_path, None)
+            if data is not None:
+                lines = self.file_cache[file_path] = _decode_lines(data)
+                return lines
+
+            # Missing files are filtered out once per run by fix_issues()
+            try:
+                lines = self.file_cache[file_path] = _read_lines(file_path)
+            except OSError as e:
+                self.logger.warning("Cannot read %s: %s", file_path, e)
                 return []
 
-            try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    self.file_cache[file_path] = file.readlines()
-            except UnicodeDecodeError:
-                # Try again with latin-1 encoding if utf-8 fails
-                with open(file_path, 'r', encoding='latin-1') as file:
-                    self.file_cache[file_path] = file.readlines()
+        return lines
+
+    def insert_lines(self, file_path: str, index: int, new_lines: List[str]) -> None:
+        """Queue lines to be inserted before ``index`` of the original file.
+
+        Insertions are applied per file by apply_inserts() once all of its
+        issues are handled, so the line numbers reported by pylint stay valid
+        while fixing.
+
+        Args:
+            file_path: Path to the file to modify
+            index: 0-based line index to insert before
+            new_lines: Lines to insert, each ending with a newline
+        """
+        self.pending_inserts[file_path].append((index, new_lines))
+
+    def apply_inserts(self, file_path: str) -> None:
+        """Apply all queued insertions for a file in a single pass.
 
-        return self.file_cache[file_path]
+        Args:
+            file_path: Path to the file to update
+        """
+        inserts = self.pending_inserts.pop(file_path, None)
+        if not inserts:
+            return
+
+        lines = self.file_cache[file_path]
+        merged: List[str] = []
+        start = 0
+        # Stable sort keeps insertions at the same index in the order queued
+        for index, new_lines in sorted(inserts, key=lambda x: x[0]):
+            merged.extend(lines[start:index])
+            merged.extend(new_lines)
+            start = index
+        merged.extend(lines[start:])
+        self.file_cache[file_path] = merged
 
     def save_file(self, file_path: str) -> None:
         """Save the modified file contents.
@@ -122,8 +360,9 @@ class CodeFixer:
             self.logger.info("[DRY RUN] Would save %s", file_path)
         else:
             try:
-                with open(file_path, 'w', encoding='utf-8') as file:
-                    file.writelines(self.file_cache[file_path])
+                data = ''.join(self.file_cache[file_path]).encode('utf-8')
+                with open(file_path, 'wb') as file:
+                    file.write(data)
                 self.logger.info("Saved: %s", file_path)
                 if file_path not in self.files_modified:
                     self.files_modified.append(file_path)
@@ -139,62 +378,74 @@ class CodeFixer:
         Returns:
             True if the issue was fixed, False otherwise
         """
+        # Extract the unused # Potential unused import: import name from the message
+        match = _RE_UNUSED.search(issue.message)
+        if not match:
+            return False
+
+        unused_import = match.group(1)
+
         lines = self.load_file(issue.file_path)
         if not lines:
             return False
 
         line = lines[issue.line_num - 1]
 
-        # Extract the unused # Potential unused import: import name from the message
-        match = re.search(r"Unused import (\w+)", issue.message)
-        if not match:
+        # Parse the import statement on its own; continuation lines of
+        # multi-line imports don't parse and are left alone
+        try:
+            tree = ast.parse(line.strip())
+        except SyntaxError:
+            return False
+        if len(tree.body) != 1 or not isinstance(tree.body[0], (ast.Import, ast.ImportFrom)):
             return False
 
-        unused_import = match.group(1)
+        node = tree.body[0]
+        remaining = [alias for alias in node.names if alias.name != unused_import]
+        if len(remaining) == len(node.names):
+            return False
 
-        # Handle different # Potential unused import: import styles
-        if re.match(rf"^\s*import\s+{unused_import}\s*$", line):
-            # Direct # Potential unused import: import (import unused)
-            lines[issue.line_num - 1] = f"# {line.rstrip()}  # removed: {issue.code}\n"
-            return True
-        elif re.match(rf"^\s*from\s+[\w.]+\s+import\s+{unused_import}\s*$", line):
-            # Single # Potential unused import: import from module (from module import unused)
+        if not remaining:
+            # The only imported name is unused: comment out the whole import
             lines[issue.line_num - 1] = f"# {line.rstrip()}  # removed: {issue.code}\n"
-            return True
-        elif re.search(rf"from\s+[\w.]+\s+import\s+[^,]+,\s*{unused_import}(\s*,|$)", line):
-            # Part of a multi-import (from module import used, unused, other)
-            if re.search(rf"{unused_import},", line):
-                # Unused # Potential unused import: import followed by comma
-                lines[issue.line_num - 1] = line.replace(f"{unused_import}, ", "")
-                return True
-            elif re.search(rf",\s*{unused_import}", line):
-                # Unused # Potential unused import: import preceded by comma
-                lines[issue.line_num - 1] = line.replace(f", {unused_import}", "")
-                return True
-
-        return False
-
-    def fix_trailing_whitespace(self, issue: PylintIssue) -> bool:
-        """Remove trailing whitespace (C0303).
+        else:
+            # Rebuild the import from the names that are still used
+            # (built by hand: ast.unparse() needs Python 3.9)
+            names = ", ".join(alias.name if alias.asname is None else f"{alias.name} as {alias.asname}"
+                              for alias in remaining)
+            if isinstance(node, ast.ImportFrom):
+                statement = f"from {'.' * node.level}{node.module or ''} import {names}"
+            else:
+                statement = f"import {names}"
+            indent = line[:_indent_len(line)]
+            comment = f"  {line[line.index('#'):].rstrip()}" if '#' in line else ""
+            lines[issue.line_num - 1] = f"{indent}{statement}{comment}\n"
+        return True
+
+    def fix_trailing_whitespace_all(self, file_path: str, issues: List[PylintIssue]) -> List[bool]:
+        """Remove trailing whitespace (C0303) for all issues of a file at once.
         
         Args:
-            issue: The pylint issue to fix
+            file_path: Path to the file the issues belong to
+            issues: The trailing whitespace issues reported for that file
             
         Returns:
-            True if the issue was fixed, False otherwise
+            One flag per issue, True if the issue was fixed
         """
-        lines = self.load_file(issue.file_path)
+        lines = self.load_file(file_path)
         if not lines:
-            return False
-
-        line = lines[issue.line_num - 1]
-        fixed_line = line.rstrip() + '\n'
+            return [False] * len(issues)
 
-        if fixed_line != line:
-            lines[issue.line_num - 1] = fixed_line
-            return True
+        results = []
+        for issue in issues:
+            line = lines[issue.line_num - 1]
+            fixed_line = line.rstrip() + '\n'
+            fixed = fixed_line != line
+            if fixed:
+                lines[issue.line_num - 1] = fixed_line
+            results.append(fixed)
 
-        return False
+        return results
 
     def fix_missing_docstring(self, issue: PylintIssue) -> bool:
         """Add missing docstrings (C0111, C0112, C0103).
@@ -205,7 +456,7 @@ class CodeFixer:
         Returns:
             True if the issue was fixed, False otherwise
         """
-        if not ("Missing docstring" in issue.message or "docstring" in issue.message.lower()):
+        if not _IS_DOCSTRING(issue.message):
             return False
 
         lines = self.load_file(issue.file_path)
@@ -215,38 +466,38 @@ class CodeFixer:
         line = lines[issue.line_num - 1]
 
         # Detect if it's a function, class, or module
-        is_func = "function" in issue.message.lower() or "def " in line
-        is_class = "class" in issue.message.lower() or "class " in line
-        is_module = "module" in issue.message.lower() or issue.line_num == 1
+        message = issue.message.lower()
+        is_func = "function" in message or "def " in line
+        is_class = "class" in message or "class " in line
+        is_module = "module" in message or issue.line_num == 1
 
-        indent = len(line) - len(line.lstrip())
-        indent_str = ' ' * indent
+        # Docstrings belong to the body, one level below the def/class line;
+        # at the line's own indent the inserted string would end the block
+        indent_str = _spaces(_indent_len(line) + 4)
 
         if is_module and issue.line_num == 1:
             # Module docstring
             module_name = os.path.basename(issue.file_path).replace('.py', '')
             module_name = module_name.replace('_', ' ').title()
-            docstring = f'"""
-                "{module_name} module for AILinux.\n\nThis module provides functionality for the AILinux system.\n"""\n'
-            lines.insert(0, docstring)
+            docstring = (f'"""\n{module_name} module for AILinux.\n\n'
+                         'This module provides functionality for the AILinux system.\n"""\n')
+            self.insert_lines(issue.file_path, 0, [docstring])
             return True
         elif is_func and "def " in line:
             # Function docstring
-            func_name = re.search(r'def\s+(\w+)', line)
+            func_name = _RE_DEF_NAME.search(line)
             if func_name:
                 name = func_name.group(1)
-                docstring = f'{indent_str}"""
-                    "\n{indent_str}Description for function {name}.\n{indent_str}"""\n'
-                lines.insert(issue.line_num, docstring)
+                docstring = f'{indent_str}"""\n{indent_str}Description for function {name}.\n{indent_str}"""\n'
+                self.insert_lines(issue.file_path, issue.line_num, [docstring])
                 return True
         elif is_class and "class " in line:
             # Class docstring
-            class_name = re.search(r'class\s+(\w+)', line)
+            class_name = _RE_CLASS_NAME.search(line)
             if class_name:
                 name = class_name.group(1)
-                docstring = f'{indent_str}"""
-                    "\n{indent_str}Description for class {name}.\n{indent_str}"""\n'
-                lines.insert(issue.line_num, docstring)
+                docstring = f'{indent_str}"""\n{indent_str}Description for class {name}.\n{indent_str}"""\n'
+                self.insert_lines(issue.file_path, issue.line_num, [docstring])
                 return True
 
         return False
@@ -263,57 +514,48 @@ class CodeFixer:
         if "Line too long" not in issue.message:
             return False
 
+        # Only lines that really exceed the limit are worth loading the file for
+        match = _RE_LINE_TOO_LONG.search(issue.message)
+        if not match or int(match.group(1)) <= int(match.group(2)):
+            return False
+
         lines = self.load_file(issue.file_path)
         if not lines:
             return False
 
         line = lines[issue.line_num - 1]
 
-        # Try to break the line if it's longer than the limit
-        match = re.search(r"Line too long \((\d+)/(\d+)\)", issue.message)
-        if match:
-            current_len = int(match.group(1))
-            limit = int(match.group(2))
-
-            if current_len <= limit:
-                return False
+        # Case 1: Fix string concatenation with "+" at the end of line
+        if '+" +' in line:
+            # There's already a string concatenation, but it's broken
+            fixed_line = line.replace('+" +', '"+\n')
+            lines[issue.line_num - 1] = fixed_line
+            return True
 
-            # Case 1: Fix string concatenation with "+" at the end of line
-            if '+" +' in line:
-                # There's already a string concatenation, but it's broken
-                fixed_line = line.replace('+" +', '"+\n')
-                lines[issue.line_num - 1] = fixed_line
+        # Case 2: Try to break a string
+        if '"' in line or "'" in line:
+            for quote in ['"', "'"]:
+                strings = _RE_QUOTED[quote].findall(line)
+                for string in strings:
+                    if len(string) > 30:  # Only split long strings
+                        indent_str = _spaces(_indent_len(line) + 4)  # Extra indentation
+                        replacement = f"{string[0]}\" +\n{indent_str}\"{string[1:-1]}{string[-1]}"
+                        new_line = line.replace(string, replacement)
+                        lines[issue.line_num - 1] = new_line
+                        return True
+
+        # Case 3: Try to break at commas (lists, function parameters)
+        if ',' in line and not ('"' in line or "'" in line):  # Avoid breaking inside strings
+            parts = line.split(',')
+            if len(parts) > 1:
+                indent_str = _spaces(_indent_len(line))
+                new_lines = ([parts[0] + ',\n'] +
+                             [f"{indent_str}{part.strip()},\n" for part in parts[1:-1]] +
+                             [f"{indent_str}{parts[-1].strip()}\n"])
+                # The split line stays in its original slot, so nothing shifts
+                lines[issue.line_num - 1] = ''.join(new_lines)
                 return True
 
-            # Case 2: Try to break a string
-            if '"' in line or "'" in line:
-                for quote in ['"', "'"]:
-                    pattern = f'({quote}[^{quote}]*{quote})'
-                    strings = re.findall(pattern, line)
-                    for string in strings:
-                        if len(string) > 30:  # Only split long strings
-                            indent = len(line) - len(line.lstrip())
-                            indent_str = ' ' * (indent + 4)  # Extra indentation
-                            replacement = f"{string[0]}\" +\n{indent_str}\"{string[1:-1]}{string[-1]}"
-                            new_line = line.replace(string, replacement)
-                            lines[issue.line_num - 1] = new_line
-                            return True
-
-            # Case 3: Try to break at commas (lists, function parameters)
-            if ',' in line and not ('"' in line or "'" in line):  # Avoid breaking inside strings
-                parts = line.split(',')
-                if len(parts) > 1:
-                    indent = len(line) - len(line.lstrip())
-                    indent_str = ' ' * indent
-                    new_lines = [parts[0] + ',']
-                    for part in parts[1:-1]:
-                        new_lines.append(indent_str + part.strip() + ',')
-                    new_lines.append(indent_str + parts[-1].strip())
-                    lines[issue.line_num - 1] = new_lines[0] + '\n'
-                    for i, new_line in enumerate(new_lines[1:], start=1):
-                        lines.insert(issue.line_num - 1 + i, new_line + '\n')
-                    return True
-
         return False
 
     def fix_f_string_logging(self, issue: PylintIssue) -> bool:
@@ -325,9 +567,7 @@ class CodeFixer:
         Returns:
             True if the issue was fixed, False otherwise
         """
-        if ("lazy % formatting in logging functions" not in issue.message and
-            "logging-fstring-interpolation" not in issue.message and
-            "logging-not-lazy" not in issue.message):
+        if not _IS_LOG_FORMAT(issue.message):
             return False
 
         lines = self.load_file(issue.file_path)
@@ -337,15 +577,27 @@ class CodeFixer:
         line = lines[issue.line_num - 1]
 
         # Regular expression to find logging calls with f-strings
-        match = re.search(r'(logger\.\w+)\(f[\'"](.+?)[\'"](,.+?)?\)', line)
+        match = _RE_LOG.search(line)
         if match:
             log_call = match.group(1)
             f_string_content = match.group(2)
             args = match.group(3) if match.group(3) else ''
 
-            # Replace f-string with % formatting
-            f_string_content = f_string_content.replace('{', '%s').replace('}', '')
-            new_line = f'{log_call}("{f_string_content}"{args})'
+            # Replace f-string fields with placeholders in one pass, collecting
+            # their expressions as the arguments of the logging call
+            converted = _fstring_to_percent(f_string_content)
+            if converted is None:
+                return False
+            f_string_content, fields = converted
+            field_args = ''.join(f', {expression}' for expression in fields)
+            new_line = f'{log_call}("{f_string_content}"{field_args}{args})'
+
+            # Only accept the rewrite if the new call compiles; the rest of
+            # the line may be a return, an else: or similar
+            try:
+                compile(new_line, issue.file_path, 'eval')
+            except SyntaxError:
+                return False
             lines[issue.line_num - 1] = line.replace(match.group(0), new_line)
             return True
 
@@ -380,12 +632,12 @@ class CodeFixer:
         # Check for issues with invalid syntax
         if "invalid syntax" in issue.message and "+" in line:
             # Try to fix broken string concatenation
-            if re.search(r'"\s*\+\s*$', line):
+            if _RE_TRAILING_PLUS.search(line):
                 # Line ends with +, join with next line
                 next_line = lines[issue.line_num] if issue.line_num < len(lines) else ""
                 if next_line and next_line.lstrip().startswith('"'):
                     # Remove + from current line and merge with next
-                    lines[issue.line_num - 1] = re.sub(r'"\s*\+\s*$', '"', line)
+                    lines[issue.line_num - 1] = _RE_TRAILING_PLUS.sub('"', line)
                     return True
 
         # Check for unclosed strings
@@ -432,103 +684,290 @@ class CodeFixer:
         if (("def " in prev_line or "class " in prev_line) and
             prev_line.rstrip().endswith(':')):
             # Add a pass statement with proper indentation
-            indent = len(prev_line) - len(prev_line.lstrip()) + 4  # 4 spaces for indentation
-            lines.insert(line_num - 1, ' ' * indent + 'pass\n')
+            indent = _indent_len(prev_line) + 4  # 4 spaces for indentation
+            self.insert_lines(issue.file_path, line_num - 1, [_spaces(indent) + 'pass\n'])
             return True
 
         return False
 
+    # Fixers by pylint code; syntax errors (E0001) try each of _SYNTAX_FIXERS
+    _FIXERS = {
+        "W0611": fix_unused_import,  # Unused import
+        "C0111": fix_missing_docstring,  # Missing docstring
+        "C0112": fix_missing_docstring,
+        "C0116": fix_missing_docstring,
+        "C0301": fix_line_too_long,  # Line too long
+        "W1201": fix_f_string_logging,  # Logging format
+        "W1203": fix_f_string_logging,
+    }
+    _SYNTAX_FIXERS = (fix_syntax_error_string_concat, fix_function_block_indentation)
+    # Fixers that take every issue of their code in a file in one call
+    _BULK_FIXERS = {
+        "C0303": fix_trailing_whitespace_all,  # Trailing whitespace
+    }
+
+    # Below this many files the process pool costs more than it saves
+    PARALLEL_MIN_FILES = 4
+
+    # Bump whenever the fixers change so stale cached results are ignored
+    CACHE_VERSION = "1"
+
+    def cache_key(self, data: bytes, issues: List[PylintIssue]) -> str:
+        """Build the result cache key for a file and the issues reported for it.
+        
+        Args:
+            data: The raw contents of the file
+            issues: The pylint issues reported for that file
+            
+        Returns:
+            Hex digest over the file contents and the issues
+        """
+        digest = hashlib.sha256(data)
+        digest.update(self.CACHE_VERSION.encode())
+        for issue in issues:
+            digest.update(f"\0{issue.line_num}:{issue.code}:{issue.message}".encode('utf-8'))
+        return digest.hexdigest()
+
+    def run_fixers(self, issues_by_file: Dict[str, List[PylintIssue]]
+                   ) -> Iterator[Tuple[str, Optional[List[str]], List[bool]]]:
+        """Fix the given files and yield the result of each one.
+        
+        Files are independent, so larger runs are spread over worker processes.
+        
+        Args:
+            issues_by_file: Pylint issues grouped by file path
+            
+        Yields:
+            The file path, its fixed lines (None if it could not be loaded)
+            and one fixed flag per issue
+        """
+        if len(issues_by_file) < self.PARALLEL_MIN_FILES:
+            for file_path, file_issues in issues_by_file.items():
+                results = self.fix_file_issues(file_path, file_issues)
+                yield file_path, self.file_cache.get(file_path), results
+        else:
+            with ProcessPoolExecutor() as executor:
+                chunksize = max(1, len(issues_by_file) // ((os.cpu_count() or 1) * 4))
+                # Contents read for the result cache travel with the issues
+                contents = [self.file_bytes.pop(file_path, None) for file_path in issues_by_file]
+                outcomes = executor.map(fix_file, issues_by_file.keys(), issues_by_file.values(),
+                                        contents, itertools.repeat(self.verbose),
+                                        chunksize=chunksize)
+                for file_path, lines, results, records in outcomes:
+                    # Log the worker's records through this process's handlers
+                    for record in records:
+                        self.logger.handle(record)
+                    yield file_path, lines, results
+
+    def fix_file_issues(self, file_path: str, issues: List[PylintIssue]) -> List[bool]:
+        """Run the matching fixer for every issue of a single file.
+        
+        Args:
+            file_path: Path to the file the issues belong to
+            issues: The pylint issues reported for that file
+            
+        Returns:
+            One flag per issue, True if the issue was fixed
+        """
+        # Resolve the debug logger once instead of checking per issue
+        log_debug = self.logger.debug if self.verbose else None
+
+        # Bucket the issues by code so each fixer runs as one tight loop;
+        # results keep the original issue order
+        buckets: Dict[str, List[int]] = defaultdict(list)
+        for index, issue in enumerate(issues):
+            buckets[issue.code].append(index)
+        results = [False] * len(issues)
+
+        # Syntax errors first: they have several candidate fixers each
+        for index in buckets.pop("E0001", ()):
+            issue = issues[index]
+            fixed = any(fixer(self, issue) for fixer in self._SYNTAX_FIXERS)
+            results[index] = fixed
+
+            if fixed and log_debug:
+                log_debug("Fixed syntax error in %s:%s", issue.file_path, issue.line_num)
+
+        for code, indices in buckets.items():
+            bulk_fixer = self._BULK_FIXERS.get(code)
+            if bulk_fixer:
+                flags = bulk_fixer(self, file_path, [issues[index] for index in indices])
+                for index, fixed in zip(indices, flags):
+                    results[index] = fixed
+                continue
+
+            fixer = self._FIXERS.get(code)
+            if fixer:
+                for index in indices:
+                    results[index] = fixer(self, issues[index])
+
+        # Insert new lines only after every issue of the file has been handled
+        if file_path in self.file_cache:
+            self.apply_inserts(file_path)
+
+        return results
+
+    def record_results(self, issues: List[PylintIssue], results: List[bool]) -> None:
+        """Update the fix statistics with the outcome of one file.
+        
+        Args:
+            issues: The issues that were processed
+            results: Whether each issue was fixed, as returned by fix_file_issues()
+        """
+        log_debug = self.logger.debug if self.verbose else None
+        for issue, fixed in zip(issues, results):
+            if fixed:
+                self.fixes_applied += 1
+                self.fixed_issues.append(issue)
+                if log_debug:
+                    log_debug("Fixed: %s", issue)
+            else:
+                self.skipped_issues += 1
+                self.unfixed_issues.append(issue)
+                if log_debug:
+                    log_debug("Skipped: %s", issue)
+
+        # Report progress roughly every 20 issues
+        processed_count = self.fixes_applied + self.skipped_issues
+        if processed_count // 20 > (processed_count - len(issues)) // 20:
+            self.logger.info("Processed %s/%s issues...", processed_count, len(self.issues))
+
     def fix_issues(self) -> int:
         """Fix all found issues and return the number of fixed problems.
         
         Returns:
             Number of issues fixed
         """
-        # Sort issues by file and line number
-        self.issues.sort(key=lambda x: (x.file_path, x.line_num))
-
-        # Group issues by file
-        issues_by_file: Dict[str, List[PylintIssue]] = {}
+        # Group issues by file in a single pass
+        issues_by_file: Dict[str, List[PylintIssue]] = defaultdict(list)
         for issue in self.issues:
-            if issue.file_path not in issues_by_file:
-                issues_by_file[issue.file_path] = []
             issues_by_file[issue.file_path].append(issue)
 
         # Print summary of issues to fix
         self.logger.info("Found %s issues in %s files", len(self.issues), len(issues_by_file))
 
-        # Process all issues
-        processed_count = 0
-        for issue in self.issues:
-            processed_count += 1
-            if processed_count % 20 == 0:
-                self.logger.info("Processing issue %s/%s...", processed_count, len(self.issues))
-
-            fixed = False
-
-            # Try syntax errors first (most critical)
-            if "E0001" in issue.code:
-                fixed = (self.fix_syntax_error_string_concat(issue) or
-                         self.fix_function_block_indentation(issue))
-
-                if fixed and self.verbose:
-                    self.logger.debug("Fixed syntax error in %s:%s", issue.file_path, issue.line_num)
-
-            # If syntax error wasn't fixed, try other fixes based on error code
-            if not fixed:
-                if issue.code == "W0611":  # Unused import
-                    fixed = self.fix_unused_import(issue)
-                elif issue.code == "C0303":  # Trailing whitespace
-                    fixed = self.fix_trailing_whitespace(issue)
-                elif issue.code in ["C0111", "C0112", "C0116"]:  # Missing docstring
-                    fixed = self.fix_missing_docstring(issue)
-                elif issue.code == "C0301":  # Line too long
-                    fixed = self.fix_line_too_long(issue)
-                elif issue.code in ["W1201", "W1203"]:  # Logging format
-                    fixed = self.fix_f_string_logging(issue)
-
-            if fixed:
-                self.fixes_applied += 1
-                self.fixed_issues.append(issue)
-                if self.verbose:
-                    self.logger.debug("Fixed: %s", issue)
-            else:
-                self.skipped_issues += 1
-                self.unfixed_issues.append(issue)
-                if self.verbose:
-                    self.logger.debug("Skipped: %s", issue)
+        # Check every distinct path once instead of on each load
+        for file_path in [path for path in issues_by_file if not os.path.isfile(path)]:
+            self.logger.warning("File not found: %s", file_path)
+            file_issues = issues_by_file.pop(file_path)
+            self.record_results(file_issues, [False] * len(file_issues))
+
+        cache = shelve.open(self.cache_file) if self.cache_file else None
+        try:
+            # Reuse earlier results for files whose contents and issues are unchanged
+            pending: Dict[str, List[PylintIssue]] = {}
+            cache_keys: Dict[str, Optional[str]] = {}
+            for file_path, file_issues in issues_by_file.items():
+                data = _read_bytes(file_path) if cache is not None else None
+                key = self.cache_key(data, file_issues) if data is not None else None
+                cached = cache.get(key) if key else None
+                if cached is None:
+                    pending[file_path] = file_issues
+                    cache_keys[file_path] = key
+                    if data is not None:
+                        # The fixers decode these bytes instead of reading the file again
+                        self.file_bytes[file_path] = data
+                    continue
+
+                lines, flags = cached
+                if lines is not None:
+                    self.file_cache[file_path] = lines
+                self.record_results(file_issues, flags)
+
+            if len(pending) < len(issues_by_file):
+                self.logger.info("Reused cached fixes for %s files",
+                                 len(issues_by_file) - len(pending))
+
+            # Process the remaining issues, one file at a time
+            for file_path, lines, flags in self.run_fixers(pending):
+                if lines is not None:
+                    self.file_cache[file_path] = lines
+                self.record_results(pending[file_path], flags)
+                if cache_keys[file_path]:
+                    cache[cache_keys[file_path]] = (lines, flags)
+        finally:
+            if cache is not None:
+                cache.close()
 
         # Save all modified files
         for file_path in self.file_cache:
             self.save_file(file_path)
 
+        if self.log_buffer:
+            self.log_buffer.flush()
+
         return self.fixes_applied
 
     def print_summary(self):
         """Print a summary of the fixes applied."""
-        print("\n" + "="*50)
-        print("SUMMARY:")
-        print(f"Total issues processed: {len(self.issues)}")
-        print(f"Fixed: {self.fixes_applied} issues")
-        print(f"Skipped: {self.skipped_issues} issues")
-        print(f"Files modified: {len(self.files_modified)}")
+        # Collect the whole summary and write it with a single call
+        output = [
+            "",
+            "=" * 50,
+            "SUMMARY:",
+            f"Total issues processed: {len(self.issues)}",
+            f"Fixed: {self.fixes_applied} issues",
+            f"Skipped: {self.skipped_issues} issues",
+            f"Files modified: {len(self.files_modified)}",
+        ]
 
         if self.files_modified:
-            print("\nModified files:")
-            for file in self.files_modified:
-                print(f"  - {file}")
+            output.append("\nModified files:")
+            output.extend(f"  - {file}" for file in self.files_modified)
 
         # Group unfixed issues by code for better overview
-        unfixed_by_code: Dict[str, int] = {}
-        for issue in self.unfixed_issues:
-            if issue.code not in unfixed_by_code:
-                unfixed_by_code[issue.code] = 0
-            unfixed_by_code[issue.code] += 1
+        unfixed_by_code = Counter(issue.code for issue in self.unfixed_issues)
 
         if unfixed_by_code:
-            print("\nUnfixed issues by type:")
-            for code, count in sorted(unfixed_by_code.items(), key=lambda x: x[1], reverse=True):
-                print(f"  {code}: {count} issues")
+            output.append("\nUnfixed issues by type:")
+            output.extend(f"  {code}: {count} issues"
+                          for code, count in unfixed_by_code.most_common())
+
+        sys.stdout.write("\n".join(output) + "\n")
+
+
+class _RecordCollector(logging.Handler):
+    """Logging handler that keeps the records of a worker process."""
+
+    def __init__(self):
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Merge the arguments into the message now so the record pickles
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.records.append(record)
+
+
+def fix_file(file_path: str, issues: List[PylintIssue], data: Optional[bytes] = None,
+             verbose: bool = False
+             ) -> Tuple[str, Optional[List[str]], List[bool], List[logging.LogRecord]]:
+    """Fix the issues of a single file; used as the worker of the process pool.
+    
+    Args:
+        file_path: Path to the file to fix
+        issues: The pylint issues reported for that file
+        data: Raw file contents the parent already read, None to read the file
+        verbose: Whether to log detailed output
+        
+    Returns:
+        The file path, the fixed lines (None if the file could not be loaded),
+        one fixed flag per issue and the log records for the parent to handle
+    """
+    # A forked worker inherits the parent's handlers, whose buffered file
+    # output would never be flushed here; collect the records instead
+    collector = _RecordCollector()
+    logging.getLogger('pylint_fixer').handlers[:] = [collector]
+
+    fixer = CodeFixer(issues, verbose=verbose)
+    if data is not None:
+        fixer.file_bytes[file_path] = data
+    results = fixer.fix_file_issues(file_path, issues)
+    return file_path, fixer.file_cache.get(file_path), results, collector.records
 
 
 def parse_pylint_log(log_path: str) -> List[PylintIssue]:
@@ -540,27 +979,23 @@ def parse_pylint_log(log_path: str) -> List[PylintIssue]:
     Returns:
         List of parsed pylint issues
     """
-    issues = []
-
     try:
         with open(log_path, 'r', encoding='utf-8') as file:
-            for line in file:
-                # Typical pylint format: file.py:42:0: C0111: Missing docstring (missing-docstring)
-                match = re.match(r'
-                    "^([\w\./\-]+):(\d+)(?::\d+)?: ([CRWE]\d{4}): (.+?)(?:\s\([\w-]+\))?$', line.strip())
-                if match:
-                    file_path, line_num, code, message = match.groups()
-                    issues.append(PylintIssue(
-                        file_path=file_path,
-                        line_num=int(line_num),
-                        code=code,
-                        message=message
-                    ))
+            content = file.read()
     except (FileNotFoundError, UnicodeDecodeError) as e:
         print(f"Error reading log file {log_path}: {e}")
         sys.exit(1)
 
-    return issues
+    # Typical pylint format: file.py:42:0: C0111: Missing docstring (missing-docstring)
+    return [
+        PylintIssue(
+            file_path=match.group(1),
+            line_num=int(match.group(2)),
+            code=match.group(3),
+            message=match.group(4)
+        )
+        for match in _RE_PYLINT_LINE.finditer(content)
+    ]
 
 
 def main():
@@ -586,6 +1021,13 @@ def main():
     parser.add_argument('--verbose', '-v', action='store_true',
                       help='Print detailed output')
 
+    parser.add_argument('--cache-file',
+                      help='Path of the cache of earlier fix results (default: .pylint_fixer_cache)',
+                      default='.pylint_fixer_cache')
+
+    parser.add_argument('--no-cache', action='store_true',
+                      help='Don\'t read or write the fix result cache')
+
     parser.add_argument('--version', action='version',
                       version='%(prog)s 1.0')
 
@@ -610,7 +1052,8 @@ def main():
         issues,
         dry_run=args.dry_run,
         log_file=args.log_file,
-        verbose=args.verbose
+        verbose=args.verbose,
+        cache_file=None if args.no_cache else args.cache_file
     )
 
     try:
@@ -17,18 +17,54 @@ import os
 import re
 import sys
 import argparse
+import functools
+import io
+import itertools
+import json
 import logging
-from typing import List, Dict, Tuple, Optional, Any
+import queue
+from logging.handlers import QueueHandler
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Set, Tuple, Optional, Any, Iterator
+
+# Patterns used for every issue, compiled once at import time
+_RE_UNUSED_VAR_MSG = re.compile(r"Unused variable '(\w+)'")
+_RE_EXCEPT_EXCEPTION = re.compile(r'except\s+Exception\s*:')
+_RE_LOG_FSTRING = re.compile(r'(logger\.\w+)\(f[\'"](.+?)[\'"](,.+?)?\)')
+# An f-string field with its optional conversion, an escaped brace, or a
+# literal % that has to be escaped for %-style formatting
+_RE_FSTRING_VAR = re.compile(r'\{\{|\}\}|%|\{([^{}]+?)(?:!([rsa]))?\}')
+# Replacements for the matches of _RE_FSTRING_VAR that are not fields
+_FSTRING_LITERALS = {'{{': '{', '}}': '}', '%': '%%'}
+_RE_CONST_NAME_MSG = re.compile(r"Constant name \"(\w+)\"")
+_RE_TRAILING_PLUS_DQ = re.compile(r'("\s*)\+\s*$')
+_RE_TRAILING_PLUS_SQ = re.compile(r"('\s*)\+\s*$")
+# A pylint message id the fixers handle (convention, refactor, warning, error)
+_RE_ISSUE_CODE = re.compile(r'[CRWE]\d{4}')
+# Typical pylint format: file.py:42:0: C0111: Missing docstring (missing-docstring)
+_RE_PYLINT_LINE = re.compile(
+    r'^([\w\./\-]+):(\d+)(?::\d+)?: ([CRWE]\d{4}): (.+?)(?:\s\([\w-]+\))?$')
+
+
+@functools.lru_cache(maxsize=1024)
+def _assign_re(name: str) -> re.Pattern:
+    """Return a compiled pattern matching an assignment to the given name."""
+    return re.compile(rf"\b({re.escape(name)})\s*=")
 
 
 class PylintIssue:
     """Represents a pylint issue from the log file."""
 
+    __slots__ = ('file_path', 'line_num', 'code', 'message')
+
     def __init__(self, file_path: str, line_num: int, code: str, message: str):
         """Initialize a new pylint issue."""
-        self.file_path = file_path
+        # Paths and codes repeat across many issues; interning shares one
+        # string object per value for both the text and the json parser
+        self.file_path = sys.intern(file_path)
         self.line_num = line_num
-        self.code = code
+        self.code = sys.intern(code)
         self.message = message
 
     def __repr__(self) -> str:
@@ -40,8 +76,8 @@ class CodeFixer:
     """Class for fixing pylint issues in code."""
 
     def __init__(self, issues: List[PylintIssue], dry_run: bool = False,
-                 log_file: Optional[str] = None, verbose: bool = False):
-        """Initialize the code fixer."""
+                 verbose: bool = False):
+        """Initialize the code fixer; handlers are set up by configure_logging()."""
         self.issues = issues
         self.dry_run = dry_run
         self.verbose = verbose
@@ -50,30 +86,12 @@ class CodeFixer:
         self.skipped_issues = 0
         self.fixed_issues: List[PylintIssue] = []
         self.unfixed_issues: List[PylintIssue] = []
-        self.files_modified: List[str] = []
+        self.files_modified: Set[str] = set()
+        # Files with at least one applied fix; only these need to be saved
+        self._dirty: Set[str] = set()
 
-        # Setup logging
         self.logger = logging.getLogger('targeted_fixer')
 
-        # Set log level based on verbose flag
-        log_level = logging.DEBUG if verbose else logging.INFO
-        self.logger.setLevel(log_level)
-
-        # Console handler
-        console = logging.StreamHandler()
-        console.setLevel(log_level)
-        formatter = logging.Formatter('%(levelname)s: %(message)s')
-        console.setFormatter(formatter)
-        self.logger.addHandler(console)
-
-        # File handler (if log_file is provided)
-        if log_file:
-            file_handler = logging.FileHandler(log_file, mode='w')
-            file_handler.setLevel(logging.DEBUG)
-            file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(file_handler)
-
     def load_file(self, file_path: str) -> List[str]:
         """Load a file into the cache if it's not already loaded."""
         if file_path not in self.file_cache:
@@ -81,13 +99,16 @@ class CodeFixer:
                 self.logger.warning("File not found: %s", file_path)
                 return []
 
+            # Read the raw bytes once and decode in memory instead of
+            # reopening the file when utf-8 decoding fails
+            with open(file_path, 'rb') as file:
+                data = file.read()
             try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    self.file_cache[file_path] = file.readlines()
+                text = data.decode('utf-8')
             except UnicodeDecodeError:
-                # Try again with latin-1 encoding if utf-8 fails
-                with open(file_path, 'r', encoding='latin-1') as file:
-                    self.file_cache[file_path] = file.readlines()
+                text = data.decode('latin-1')
+            # newline=None keeps the universal-newline handling of text mode
+            self.file_cache[file_path] = io.StringIO(text, newline=None).readlines()
 
         return self.file_cache[file_path]
 
@@ -96,63 +117,68 @@ class CodeFixer:
         if self.dry_run:
             self.logger.info("[DRY RUN] Would save %s", file_path)
         else:
+            # Write the whole file with a single call to a temporary file and
+            # move it into place, so an interrupted run never leaves it half written
+            tmp_path = file_path + '.tmp'
             try:
-                with open(file_path, 'w', encoding='utf-8') as file:
-                    file.writelines(self.file_cache[file_path])
+                data = ''.join(self.file_cache[file_path]).encode('utf-8')
+                with open(tmp_path, 'wb') as file:
+                    file.write(data)
+                os.chmod(tmp_path, os.stat(file_path).st_mode)
+                os.replace(tmp_path, file_path)
                 self.logger.info("Saved: %s", file_path)
-                if file_path not in self.files_modified:
-                    self.files_modified.append(file_path)
+                self.files_modified.add(file_path)
             except Exception as e:
                 self.logger.error("Error saving %s: %s", file_path, e)
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
 
-    def fix_trailing_whitespace(self, issue: PylintIssue) -> bool:
-        """Remove trailing whitespace (C0303)."""
-        lines = self.load_file(issue.file_path)
+    def fix_trailing_whitespace_file(self, file_path: str,
+                                     issues: List[PylintIssue]) -> List[bool]:
+        """Remove trailing whitespace (C0303) for all issues of one file at once."""
+        lines = self.load_file(file_path)
         if not lines:
-            return False
-
-        line = lines[issue.line_num - 1]
-        fixed_line = line.rstrip() + '\n'
+            return [False] * len(issues)
 
-        if fixed_line != line:
-            lines[issue.line_num - 1] = fixed_line
-            return True
+        results = []
+        for issue in issues:
+            line = lines[issue.line_num - 1]
+            fixed_line = line.rstrip() + '\n'
+            fixed = fixed_line != line
+            if fixed:
+                lines[issue.line_num - 1] = fixed_line
+            results.append(fixed)
 
-        return False
+        return results
 
     def fix_unused_variable(self, issue: PylintIssue) -> bool:
         """Fix unused variables (W0612)."""
-        if "Unused variable" not in issue.message:
+        # Extract the variable name before touching the file
+        match = _RE_UNUSED_VAR_MSG.search(issue.message)
+        if not match:
             return False
 
+        var_name = match.group(1)
+
         lines = self.load_file(issue.file_path)
         if not lines:
             return False
 
         line = lines[issue.line_num - 1]
 
-        # Extract the variable name
-        match = re.search(r"Unused variable '(\w+)'", issue.message)
-        if not match:
-            return False
-
-        var_name = match.group(1)
-
         # Check if it's a simple assignment
-        assignment_match = re.search(rf"\b({var_name})\s*=", line)
+        assignment_match = _assign_re(var_name).search(line)
         if assignment_match:
-            # Replace variable name with underscore to indicate it's intentionally unused
-            replaced_line = line.replace(assignment_match.group(1), '_' + var_name)
-            lines[issue.line_num - 1] = replaced_line
+            # Prefix the assigned name with an underscore to indicate it's intentionally
+            # unused; only the assignment target is touched
+            start, end = assignment_match.span(1)
+            lines[issue.line_num - 1] = line[:start] + '_' + var_name + line[end:]
             return True
 
         return False
 
     def fix_broad_exception(self, issue: PylintIssue) -> bool:
         """Fix broad exception catching (W0718)."""
-        if "Catching too general exception" not in issue.message:
-            return False
-
         lines = self.load_file(issue.file_path)
         if not lines:
             return False
@@ -160,7 +186,7 @@ class CodeFixer:
         line = lines[issue.line_num - 1]
 
         # Check if it's a simple 'except Exception:' or 'except Exception:'
-        if re.search(r'except\s+Exception\s*:', line):
+        if _RE_EXCEPT_EXCEPTION.search(line):
             # Replace with except (Exception, RuntimeError):
             replaced_line = line.replace('except Exception:', 'except (Exception, RuntimeError):')
             lines[issue.line_num - 1] = replaced_line
@@ -170,9 +196,6 @@ class CodeFixer:
 
     def fix_f_string_logging(self, issue: PylintIssue) -> bool:
         """Fix f-string usage in logging calls (W1203)."""
-        if "lazy % formatting in logging functions" not in issue.message:
-            return False
-
         lines = self.load_file(issue.file_path)
         if not lines:
             return False
@@ -180,17 +203,23 @@ class CodeFixer:
         line = lines[issue.line_num - 1]
 
         # Regular expression to find logging calls with f-strings
-        match = re.search(r'(logger\.\w+)\(f[\'"](.+?)[\'"](,.+?)?\)', line)
+        match = _RE_LOG_FSTRING.search(line)
         if match:
             log_call = match.group(1)
             f_string_content = match.group(2)
             args = match.group(3) if match.group(3) else ''
 
-            # Extract variables from f-string
-            vars_in_f_string = re.findall(r'{([^}]+)}', f_string_content)
+            # Replace f-string fields with % formatting, collecting the variables in the same pass
+            vars_in_f_string = []
 
-            # Replace f-string with % formatting
-            modified_content = re.sub(r'{([^}]+)}', '%s', f_string_content)
+            def to_placeholder(field: re.Match) -> str:
+                expression = field.group(1)
+                if expression is None:
+                    return _FSTRING_LITERALS[field.group(0)]
+                vars_in_f_string.append(expression.strip())
+                return '%' + (field.group(2) or 's')
+
+            modified_content = _RE_FSTRING_VAR.sub(to_placeholder, f_string_content)
 
             # If variables were found, add them to the args
             if vars_in_f_string:
@@ -202,9 +231,16 @@ class CodeFixer:
                     # Create new args
                     new_line = f'{log_call}("{modified_content}", {var_args})'
             else:
-                # No variables found
+                # No variables found; logging leaves the message unformatted
+                modified_content = modified_content.replace('%%', '%')
                 new_line = f'{log_call}("{modified_content}"{args})'
 
+            # Format specs and broken fields don't compile as arguments; the
+            # rest of the line may be a return, an else: or similar
+            try:
+                compile(new_line, issue.file_path, 'eval')
+            except SyntaxError:
+                return False
             lines[issue.line_num - 1] = line.replace(match.group(0), new_line)
             return True
 
@@ -212,39 +248,33 @@ class CodeFixer:
 
     def fix_constant_naming(self, issue: PylintIssue) -> bool:
         """Fix constant naming style (C0103)."""
-        if "Constant name" not in issue.message or "
-            "doesn't conform to UPPER_CASE" not in issue.message:
+        # Extract the constant name; other C0103 naming messages don't match
+        match = _RE_CONST_NAME_MSG.search(issue.message)
+        if not match:
             return False
 
+        const_name = match.group(1)
+
         lines = self.load_file(issue.file_path)
         if not lines:
             return False
 
         line = lines[issue.line_num - 1]
 
-        # Extract the constant name
-        match = re.search(r"Constant name \"(\w+)\"", issue.message)
-        if not match:
-            return False
-
-        const_name = match.group(1)
-
         # Convert to UPPER_CASE
         upper_name = const_name.upper()
 
-        # Replace the name
-        if re.search(rf"\b{const_name}\s*=", line):
-            replaced_line = line.replace(const_name, upper_name)
-            lines[issue.line_num - 1] = replaced_line
+        # Replace the name of the assignment target only
+        assignment_match = _assign_re(const_name).search(line)
+        if assignment_match:
+            start, end = assignment_match.span(1)
+            lines[issue.line_num - 1] = line[:start] + upper_name + line[end:]
             return True
 
         return False
 
     def fix_syntax_error(self, issue: PylintIssue) -> bool:
         """Fix syntax errors (E0001)."""
-        if "E0001" not in issue.code:
-            return False
-
         lines = self.load_file(issue.file_path)
         if not lines:
             return False
@@ -256,10 +286,10 @@ class CodeFixer:
         line = lines[line_num - 1]
 
         # Check for string concatenation issues
-        if re.search(r'"\s*\+\s*$', line) or re.search(r"'\s*\+\s*$", line):
+        if _RE_TRAILING_PLUS_DQ.search(line) or _RE_TRAILING_PLUS_SQ.search(line):
             # Fix trailing + by removing it
-            fixed_line = re.sub(r'("\s*)\+\s*$', r'\1', line)
-            fixed_line = re.sub(r"('\s*)\+\s*$", r'\1', fixed_line)
+            fixed_line = _RE_TRAILING_PLUS_DQ.sub(r'\1', line)
+            fixed_line = _RE_TRAILING_PLUS_SQ.sub(r'\1', fixed_line)
             lines[line_num - 1] = fixed_line
             return True
 
@@ -275,71 +305,127 @@ class CodeFixer:
 
         # Check for unterminated string literals
         if "unterminated string literal" in issue.message:
-            # Count quotes to see if they're balanced
-            single_quotes = line.count("'")
-            double_quotes = line.count('"')
-
-            if single_quotes % 2 == 1:  # Odd number of single quotes
+            # Count quotes to see if they're balanced; double quotes are
+            # only counted when the single quotes already are
+            if line.count("'") % 2 == 1:  # Odd number of single quotes
                 lines[line_num - 1] = line.rstrip() + "'\n"
                 return True
 
-            if double_quotes % 2 == 1:  # Odd number of double quotes
+            if line.count('"') % 2 == 1:  # Odd number of double quotes
                 lines[line_num - 1] = line.rstrip() + '"\n'
                 return True
 
         return False
 
+    # Fixers by pylint code; trailing whitespace (C0303) is batched per file instead
+    _FIXERS = {
+        "W0612": fix_unused_variable,  # Unused variable
+        "W0718": fix_broad_exception,  # Broad exception
+        "W1203": fix_f_string_logging,  # F-string in logging
+        "C0103": fix_constant_naming,  # Constant naming
+        "E0001": fix_syntax_error,  # Syntax error
+    }
+
+    # Below this many files the process pool costs more than it saves
+    PARALLEL_MIN_FILES = 4
+
+    def record_result(self, issue: PylintIssue, fixed: bool) -> None:
+        """Update the fix statistics with the outcome of one issue."""
+        if fixed:
+            self._dirty.add(issue.file_path)
+            self.fixes_applied += 1
+            self.fixed_issues.append(issue)
+            if self.verbose:
+                self.logger.debug("Fixed: %s", issue)
+        else:
+            self.skipped_issues += 1
+            self.unfixed_issues.append(issue)
+            if self.verbose:
+                self.logger.debug("Skipped: %s", issue)
+
+    def fix_file_issues(self, file_path: str, issues: List[PylintIssue]) -> List[bool]:
+        """Fix all issues of a single file and return one fixed flag per issue."""
+        results = [False] * len(issues)
+
+        # Trailing whitespace is the most common issue, fix it in one pass
+        whitespace = [index for index, issue in enumerate(issues) if issue.code == "C0303"]
+        if whitespace:
+            flags = self.fix_trailing_whitespace_file(
+                file_path, [issues[index] for index in whitespace])
+            for index, fixed in zip(whitespace, flags):
+                results[index] = fixed
+
+        # Process the remaining issues in order: syntax errors first, then others
+        # (the sort is stable)
+        for index in sorted(range(len(issues)), key=lambda index: issues[index].code != "E0001"):
+            issue = issues[index]
+            if issue.code == "C0303":  # Trailing whitespace, already handled above
+                continue
+
+            # Apply the appropriate fixer based on the issue code
+            fixer = self._FIXERS.get(issue.code)
+            if fixer:
+                results[index] = fixer(self, issue)
+
+        return results
+
+    def run_fixers(self, issues_by_file: Dict[str, List[PylintIssue]]
+                   ) -> Iterator[Tuple[str, Optional[List[str]], List[bool]]]:
+        """Fix the given files and yield the path, fixed lines and flags of each one.
+        
+        Files are independent, so larger runs are spread over worker processes.
+        """
+        if len(issues_by_file) < self.PARALLEL_MIN_FILES:
+            for file_path, file_issues in issues_by_file.items():
+                results = self.fix_file_issues(file_path, file_issues)
+                yield file_path, self.file_cache.get(file_path), results
+        else:
+            with ProcessPoolExecutor() as executor:
+                chunksize = max(1, len(issues_by_file) // ((os.cpu_count() or 1) * 4))
+                for file_path, lines, results, records in executor.map(
+                        fix_file, issues_by_file.keys(), issues_by_file.values(),
+                        itertools.repeat(self.verbose), chunksize=chunksize):
+                    # Worker output goes through the handlers set up here
+                    for record in records:
+                        self.logger.handle(record)
+                    yield file_path, lines, results
+
     def fix_issues(self) -> int:
         """Fix all found issues and return the number of fixed problems."""
+        # Drop issues pylint reported more than once for the same line and code
+        seen = set()
+        unique_issues = []
+        for issue in self.issues:
+            key = (issue.file_path, issue.line_num, issue.code)
+            if key not in seen:
+                seen.add(key)
+                unique_issues.append(issue)
+        if len(unique_issues) < len(self.issues):
+            self.logger.info("Ignoring %s duplicate issues",
+                             len(self.issues) - len(unique_issues))
+            self.issues = unique_issues
+
         # Group issues by file to process multiple changes to the same file efficiently
-        issues_by_file: Dict[str, List[PylintIssue]] = {}
+        issues_by_file: Dict[str, List[PylintIssue]] = defaultdict(list)
+        syntax_error_count = 0
         for issue in self.issues:
-            if issue.file_path not in issues_by_file:
-                issues_by_file[issue.file_path] = []
             issues_by_file[issue.file_path].append(issue)
-
-        # Process priority issues first (syntax errors)
-        syntax_errors = [issue for issue in self.issues if issue.code == "E0001"]
-        other_issues = [issue for issue in self.issues if issue.code != "E0001"]
-
-        # Process issues in order: syntax errors first, then others
-        all_issues_ordered = syntax_errors + other_issues
+            if issue.code == "E0001":
+                syntax_error_count += 1
 
         # Print summary of issues to fix
         self.logger.info("Found %s issues in %s files", len(self.issues), len(issues_by_file))
-        self.logger.info("Fixing %s syntax errors first", len(syntax_errors))
+        self.logger.info("Fixing %s syntax errors first", syntax_error_count)
 
-        # Process all issues
-        for issue in all_issues_ordered:
-            fixed = False
+        for file_path, lines, results in self.run_fixers(issues_by_file):
+            # Take over the lines fixed by a worker process
+            if lines is not None:
+                self.file_cache[file_path] = lines
+            for issue, fixed in zip(issues_by_file[file_path], results):
+                self.record_result(issue, fixed)
 
-            # Apply the appropriate fixer based on the issue code
-            if issue.code == "C0303":  # Trailing whitespace
-                fixed = self.fix_trailing_whitespace(issue)
-            elif issue.code == "W0612":  # Unused variable
-                fixed = self.fix_unused_variable(issue)
-            elif issue.code == "W0718":  # Broad exception
-                fixed = self.fix_broad_exception(issue)
-            elif issue.code == "W1203":  # F-string in logging
-                fixed = self.fix_f_string_logging(issue)
-            elif issue.code == "C0103":  # Constant naming
-                fixed = self.fix_constant_naming(issue)
-            elif issue.code == "E0001":  # Syntax error
-                fixed = self.fix_syntax_error(issue)
-
-            if fixed:
-                self.fixes_applied += 1
-                self.fixed_issues.append(issue)
-                if self.verbose:
-                    self.logger.debug("Fixed: %s", issue)
-            else:
-                self.skipped_issues += 1
-                self.unfixed_issues.append(issue)
-                if self.verbose:
-                    self.logger.debug("Skipped: %s", issue)
-
-        # Save all modified files
-        for file_path in self.file_cache:
+        # Save the files that were actually changed
+        for file_path in self._dirty:
             self.save_file(file_path)
 
         return self.fixes_applied
@@ -355,37 +441,87 @@ class CodeFixer:
 
         if self.files_modified:
             print("\nModified files:")
-            for file in self.files_modified:
+            for file in sorted(self.files_modified):
                 print(f"  - {file}")
 
         # Group fixed issues by code for better overview
-        fixed_by_code: Dict[str, int] = {}
-        for issue in self.fixed_issues:
-            if issue.code not in fixed_by_code:
-                fixed_by_code[issue.code] = 0
-            fixed_by_code[issue.code] += 1
+        fixed_by_code = Counter(issue.code for issue in self.fixed_issues)
 
         if fixed_by_code:
             print("\nFixed issues by type:")
-            for code, count in sorted(fixed_by_code.items(), key=lambda x: x[1], reverse=True):
+            for code, count in fixed_by_code.most_common():
                 print(f"  {code}: {count} issues")
 
         # Group unfixed issues by code for better overview
         if self.unfixed_issues:
-            unfixed_by_code: Dict[str, int] = {}
-            for issue in self.unfixed_issues:
-                if issue.code not in unfixed_by_code:
-                    unfixed_by_code[issue.code] = 0
-                unfixed_by_code[issue.code] += 1
+            unfixed_by_code = Counter(issue.code for issue in self.unfixed_issues)
 
             print("\nRemaining issues by type:")
-            for code, count in sorted(unfixed_by_code.items(), key=lambda x: x[1], reverse=True):
+            for code, count in unfixed_by_code.most_common():
                 print(f"  {code}: {count} issues")
 
 
+def fix_file(file_path: str, issues: List[PylintIssue], verbose: bool = False
+             ) -> Tuple[str, Optional[List[str]], List[bool], List[logging.LogRecord]]:
+    """Process pool worker: fix one file and return its lines, flags and log records.
+    
+    Records are handed back to the parent instead of being written by the
+    handlers this process may have inherited from it.
+    """
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    logger = logging.getLogger('targeted_fixer')
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    # QueueHandler merges the message arguments, so the records can be pickled
+    logger.handlers[:] = [QueueHandler(records)]
+
+    fixer = CodeFixer(issues, verbose=verbose)
+    results = fixer.fix_file_issues(file_path, issues)
+    return (file_path, fixer.file_cache.get(file_path), results,
+            [records.get() for _ in range(records.qsize())])
+
+
+def parse_json_log(data: Any, target_codes: Optional[List[str]] = None) -> List[PylintIssue]:
+    """Extract issues from pylint's json or json2 output.
+    
+    Args:
+        data: The decoded log, a list of messages (json) or a dict with a
+            "messages" list (json2)
+        target_codes: Specific pylint codes to focus on (e.g., ["C0303", "W0612"])
+        
+    Returns:
+        List of parsed pylint issues
+    """
+    messages = data.get("messages", []) if isinstance(data, dict) else data
+
+    issues = []
+    for message in messages:
+        code = message.get("message-id") or message.get("messageId")
+
+        # Same message ids as the text log: fatal/info messages and entries
+        # without an id are skipped
+        if not code or not _RE_ISSUE_CODE.fullmatch(code):
+            continue
+
+        # Filter by target codes if specified
+        if target_codes and code not in target_codes:
+            continue
+
+        issues.append(PylintIssue(
+            file_path=message["path"],
+            line_num=int(message["line"]),
+            code=code,
+            message=message["message"]
+        ))
+
+    return issues
+
+
 def parse_pylint_log(log_path: str, target_codes: Optional[List[str]] = None) -> List[PylintIssue]:
     """Parse the pylint log file and extract issues.
     
+    Both the default text output and --output-format=json/json2 are accepted;
+    json logs are decoded directly without any per-line pattern matching.
+    
     Args:
         log_path: Path to the pylint log file
         target_codes: Specific pylint codes to focus on (e.g., ["C0303", "W0612"])
@@ -396,11 +532,28 @@ def parse_pylint_log(log_path: str, target_codes: Optional[List[str]] = None) ->
     issues = []
 
     try:
-        with open(log_path, 'r', encoding='utf-8') as file:
+        # utf-8-sig drops a leading BOM, so it cannot hide the json marker
+        with open(log_path, 'r', encoding='utf-8-sig') as file:
+            first = file.read(1)
+            while first.isspace():
+                first = file.read(1)
+            if first in ('[', '{'):
+                file.seek(0)
+                return parse_json_log(json.load(file), target_codes)
+            file.seek(0)
+
             for line in file:
-                # Typical pylint format: file.py:42:0: C0111: Missing docstring (missing-docstring)
-                match = re.match(r'
-                    "^([\w\./\-]+):(\d+)(?::\d+)?: ([CRWE]\d{4}): (.+?)(?:\s\([\w-]+\))?$', line.strip())
+                line = line.strip()
+
+                # Cheap split check first, so non-issue lines never reach the regex
+                parts = line.split(': ', 2)
+                if len(parts) < 3:
+                    continue
+                code = parts[1]
+                if len(code) != 5 or code[0] not in 'CRWE':
+                    continue
+
+                match = _RE_PYLINT_LINE.match(line)
                 if match:
                     file_path, line_num, code, message = match.groups()
 
@@ -414,13 +567,41 @@ def parse_pylint_log(log_path: str, target_codes: Optional[List[str]] = None) ->
                         code=code,
                         message=message
                     ))
-    except (FileNotFoundError, UnicodeDecodeError) as e:
+    except (FileNotFoundError, UnicodeDecodeError, ValueError, KeyError) as e:
         print(f"Error reading log file {log_path}: {e}")
         sys.exit(1)
 
     return issues
 
 
+def configure_logging(log_file: Optional[str] = None, verbose: bool = False) -> None:
+    """Set up the console and file handlers of the fixer's logger.
+    
+    Meant to be called once per process; calling it again replaces the
+    previous handlers instead of adding more.
+    """
+    logger = logging.getLogger('targeted_fixer')
+    log_level = logging.DEBUG if verbose else logging.INFO
+    logger.setLevel(log_level)
+
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
+
+    # Console handler
+    console = logging.StreamHandler()
+    console.setLevel(log_level)
+    console.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+    logger.addHandler(console)
+
+    # File handler (if log_file is provided)
+    if log_file:
+        file_handler = logging.FileHandler(log_file, mode='w')
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        logger.addHandler(file_handler)
+
+
 def main():
     """Main function to parse arguments and run the fixer."""
     parser = argparse.ArgumentParser(
@@ -460,11 +641,12 @@ def main():
 
     print(f"Found {len(issues)} issues to fix.")
 
+    configure_logging(args.log_file, args.verbose)
+
     # Create and run the CodeFixer
     fixer = CodeFixer(
         issues,
         dry_run=args.dry_run,
-        log_file=args.log_file,
         verbose=args.verbose
     )
 